@@ -0,0 +1,111 @@
+"""Какие годы статического хранилища РСОШ уже опубликованы.
+
+Фоновая задача периодически отправляет HEAD-запрос к файлу STORAGE_PROBE_PATH внутри
+compiled-storage-{year}/. 404 означает, что год ещё не опубликован; любой другой ответ,
+кроме 5xx, — что год доступен. При ошибках сети и 5xx прежнее состояние года сохраняется.
+Непроверенные годы считаются доступными.
+
+Без STORAGE_PROBE_PATH проверка не запускается: статические хосты часто отвечают 404
+на URL каталога и для опубликованных лет, и тогда все годы ошибочно считались бы
+недоступными.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+
+from .config import STORAGE_PROBE_ENABLED, STORAGE_PROBE_INTERVAL, STORAGE_PROBE_PATH, STORAGE_PROBE_YEARS_BACK
+from .http_client import http_client
+from .utils import build_storage_url
+
+logger = logging.getLogger(__name__)
+
+# year -> доступен ли год; отсутствие ключа означает «ещё не проверялся»
+STORAGE_YEARS: Dict[int, bool] = {}
+LAST_PROBE_AT: Optional[float] = None
+_PROBER: Optional[asyncio.Task] = None
+
+
+def is_year_available(year: int) -> bool:
+    return STORAGE_YEARS.get(year, True)
+
+
+def filter_available(years: Iterable[int]) -> List[int]:
+    return [year for year in years if STORAGE_YEARS.get(year, True)]
+
+
+def mark_available(year: int):
+    """Отмечает год доступным по успешному ответу на обычный запрос"""
+    STORAGE_YEARS[year] = True
+
+
+def probe_years() -> List[int]:
+    current_year = datetime.now().year
+    return list(range(current_year + 1, current_year - STORAGE_PROBE_YEARS_BACK, -1))
+
+
+async def probe_year(client: httpx.AsyncClient, year: int) -> Optional[bool]:
+    url = build_storage_url(year) + STORAGE_PROBE_PATH
+    try:
+        response = await client.head(url)
+    except httpx.RequestError as exc:
+        logger.warning(f"Storage probe failed for {year}: {exc}")
+        return None
+    if response.status_code == 404:
+        return False
+    if response.status_code >= 500:
+        logger.warning(f"Storage probe for {year} returned {response.status_code}")
+        return None
+    return True
+
+
+async def probe_storage():
+    global LAST_PROBE_AT
+    years = probe_years()
+    async with http_client() as client:
+        results = await asyncio.gather(*[probe_year(client, year) for year in years])
+    for year, available in zip(years, results):
+        if available is not None:
+            STORAGE_YEARS[year] = available
+    LAST_PROBE_AT = time.time()
+    logger.info(f"Storage years available: {sorted(y for y, ok in STORAGE_YEARS.items() if ok)}")
+
+
+async def _probe_loop():
+    while True:
+        try:
+            await probe_storage()
+        except Exception as e:
+            logger.exception(f"Storage probe failed: {e}")
+        await asyncio.sleep(STORAGE_PROBE_INTERVAL)
+
+
+async def start_storage_prober():
+    global _PROBER
+    if not STORAGE_PROBE_ENABLED or _PROBER is not None:
+        return
+    if not STORAGE_PROBE_PATH:
+        logger.warning("Storage probe disabled: STORAGE_PROBE_PATH is not set")
+        return
+    _PROBER = asyncio.create_task(_probe_loop())
+
+
+async def stop_storage_prober():
+    global _PROBER
+    if _PROBER is not None:
+        _PROBER.cancel()
+        await asyncio.gather(_PROBER, return_exceptions=True)
+        _PROBER = None
+
+
+def storage_status() -> dict:
+    return {
+        "probing": _PROBER is not None,
+        "probe_path": STORAGE_PROBE_PATH or None,
+        "available": sorted(year for year, ok in STORAGE_YEARS.items() if ok),
+        "unavailable": sorted(year for year, ok in STORAGE_YEARS.items() if not ok),
+        "last_probe_at": datetime.fromtimestamp(LAST_PROBE_AT).isoformat() if LAST_PROBE_AT else None,
+    }
@@ -0,0 +1,108 @@
+"""LRU-кэш с временем жизни записей и ограничением по числу записей и памяти"""
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, List, NamedTuple, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    size: int
+
+
+def deep_sizeof(value: Any) -> int:
+    """Приблизительный размер значения в байтах вместе с вложенными объектами"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(k) + deep_sizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += deep_sizeof(vars(value))
+    return size
+
+
+class TTLCache(Generic[V]):
+    """Кэш в памяти процесса: LRU-вытеснение, TTL на запись, счётчики попаданий"""
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int = 0,
+        sizeof: Callable[[Any], int] = deep_sizeof,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: Hashable, value: V, ttl: float):
+        if self.max_entries <= 0 or ttl <= 0:
+            return
+        size = self._sizeof(value) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            return
+        if key in self._data:
+            self._remove(key)
+        self._data[key] = _Entry(value, self._clock() + ttl, size)
+        self.bytes += size
+        while len(self._data) > self.max_entries or (self.max_bytes and self.bytes > self.max_bytes):
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        if key not in self._data:
+            return False
+        self._remove(key)
+        return True
+
+    def keys(self) -> List[Hashable]:
+        return list(self._data)
+
+    def clear(self) -> int:
+        count = len(self._data)
+        self._data.clear()
+        self.bytes = 0
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._data),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key: Hashable):
+        entry = self._data.pop(key)
+        self.bytes -= entry.size
@@ -0,0 +1,129 @@
+"""Настройки сервиса, задаваемые через переменные окружения"""
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_mapping(name: str) -> dict:
+    """Строка вида «ключ=значение,ключ=значение» → dict"""
+    pairs = (item.split("=", 1) for item in os.getenv(name, "").split(",") if "=" in item)
+    return {key.strip(): value.strip() for key, value in pairs}
+
+
+# Адрес сайта с дипломами; переопределяется для нагрузочных тестов с локальной заглушкой
+RSOSH_BASE_URL = os.getenv("RSOSH_BASE_URL", "https://diploma.rsr-olymp.ru").rstrip("/")
+
+# Перечни олимпиад вузов: {ELIGIBILITY_DIR}/{вуз}/{учебный год}.json, например mai/2024-25.json
+ELIGIBILITY_DIR = os.getenv("ELIGIBILITY_DIR", os.path.join(os.path.dirname(__file__), "data", "eligibility"))
+# Учебный год действующего перечня вуза, например «mai=2024-25»; для остальных вузов — последний из имеющихся
+ELIGIBILITY_ACADEMIC_YEARS = _env_mapping("ELIGIBILITY_ACADEMIC_YEARS")
+# Период проверки изменений файлов перечней, секунды (0 — только через /admin/eligibility/reload)
+ELIGIBILITY_RELOAD_INTERVAL = _env_float("ELIGIBILITY_RELOAD_INTERVAL", 30.0)
+
+# Разрешить откат на js2py, если быстрый парсер codes.js не справился с файлом
+JS2PY_FALLBACK = _env_bool("JS2PY_FALLBACK", False)
+
+# Общий httpx.AsyncClient для запросов к diploma.rsr-olymp.ru
+HTTP_MAX_CONNECTIONS = _env_int("HTTP_MAX_CONNECTIONS", 100)
+HTTP_MAX_KEEPALIVE_CONNECTIONS = _env_int("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20)
+HTTP_KEEPALIVE_EXPIRY = _env_float("HTTP_KEEPALIVE_EXPIRY", 30.0)
+HTTP_TIMEOUT = _env_float("HTTP_TIMEOUT", 5.0)
+HTTP2_ENABLED = _env_bool("HTTP2_ENABLED", False)
+# Максимум одновременных запросов к одному хосту (0 — без ограничения)
+HTTP_MAX_REQUESTS_PER_HOST = _env_int("HTTP_MAX_REQUESTS_PER_HOST", 50)
+
+# Кэш итоговых результатов /check по хэшу персоны
+RESULT_CACHE_TTL = _env_float("RESULT_CACHE_TTL", 3600.0)
+RESULT_CACHE_NEGATIVE_TTL = _env_float("RESULT_CACHE_NEGATIVE_TTL", 300.0)
+RESULT_CACHE_MAX_ENTRIES = _env_int("RESULT_CACHE_MAX_ENTRIES", 10000)
+RESULT_CACHE_MAX_BYTES = _env_int("RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+# Токен для /admin/* (заголовок X-Admin-Token); без него /admin/* недоступны
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+# Кэш разобранных ответов по (год, хэш персоны)
+YEAR_CACHE_MAX_ENTRIES = _env_int("YEAR_CACHE_MAX_ENTRIES", 50000)
+YEAR_CACHE_MAX_BYTES = _env_int("YEAR_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+YEAR_CACHE_HISTORICAL_TTL = _env_float("YEAR_CACHE_HISTORICAL_TTL", 7 * 24 * 3600.0)
+YEAR_CACHE_CURRENT_TTL = _env_float("YEAR_CACHE_CURRENT_TTL", 24 * 3600.0)
+# Сколько последних лет хранилища перепроверять условным запросом (If-None-Match/If-Modified-Since)
+YEAR_CACHE_REVALIDATE_YEARS = _env_int("YEAR_CACHE_REVALIDATE_YEARS", 1)
+
+# Постоянное хранилище ответов в SQLite; пустой путь отключает хранилище
+DIPLOMA_STORE_PATH = os.getenv("DIPLOMA_STORE_PATH", "")
+DIPLOMA_STORE_RETENTION_DAYS = _env_float("DIPLOMA_STORE_RETENTION_DAYS", 30.0)
+DIPLOMA_STORE_NEGATIVE_RETENTION_DAYS = _env_float("DIPLOMA_STORE_NEGATIVE_RETENTION_DAYS", 3.0)
+
+# Пакетная проверка /check/batch
+BATCH_MAX_SIZE = _env_int("BATCH_MAX_SIZE", 5000)
+# Сколько персон проверяется одновременно во всех пакетах процесса
+BATCH_CONCURRENCY = _env_int("BATCH_CONCURRENCY", 20)
+
+# Фоновые задания по загруженным CSV/XLSX
+JOB_WORKERS = _env_int("JOB_WORKERS", 2)
+JOB_MAX_ROWS = _env_int("JOB_MAX_ROWS", 20000)
+# Сколько заданий хранится в памяти вместе с файлами результатов
+JOB_RETENTION = _env_int("JOB_RETENTION", 100)
+
+# Объединять одновременные запросы одного года для одной персоны (помимо объединения по персоне)
+SINGLEFLIGHT_PER_YEAR = _env_bool("SINGLEFLIGHT_PER_YEAR", True)
+
+# Запрашивать только годы, в которые персона по дате рождения могла учиться в 10–11 классе
+YEAR_PLANNER_ENABLED = _env_bool("YEAR_PLANNER_ENABLED", True)
+# Запас в годах в обе стороны от расчётных лет 10–11 класса
+YEAR_PLANNER_SLACK = _env_int("YEAR_PLANNER_SLACK", 1)
+
+# Фоновая проверка опубликованных лет хранилища compiled-storage-{year}
+STORAGE_PROBE_ENABLED = _env_bool("STORAGE_PROBE_ENABLED", True)
+STORAGE_PROBE_INTERVAL = _env_float("STORAGE_PROBE_INTERVAL", 3600.0)
+# Файл внутри compiled-storage-{year}/, к которому отправляется HEAD-запрос. По умолчанию не задан,
+# и проверка не запускается: URL каталога может отвечать 404 и для опубликованных лет,
+# а надёжного общего файла в хранилище РСОШ не подтверждено. /admin/storage-years до настройки пуст
+STORAGE_PROBE_PATH = os.getenv("STORAGE_PROBE_PATH", "")
+STORAGE_PROBE_YEARS_BACK = _env_int("STORAGE_PROBE_YEARS_BACK", 8)
+
+# Устойчивость запросов к РСОШ
+UPSTREAM_RETRIES = _env_int("UPSTREAM_RETRIES", 2)
+UPSTREAM_RETRY_BASE_DELAY = _env_float("UPSTREAM_RETRY_BASE_DELAY", 0.2)
+# Дублирующий запрос отправляется, если первый не ответил за p95 задержки (не меньше HEDGE_MIN_DELAY)
+HEDGE_ENABLED = _env_bool("HEDGE_ENABLED", True)
+HEDGE_MIN_DELAY = _env_float("HEDGE_MIN_DELAY", 0.05)
+HEDGE_DEFAULT_DELAY = _env_float("HEDGE_DEFAULT_DELAY", 1.0)
+# Общий бюджет времени на проверку персоны; 0 — без ограничения
+CHECK_DEADLINE = _env_float("CHECK_DEADLINE", 8.0)
+# Значение Retry-After для ответов 503 при недоступности РСОШ
+RETRY_AFTER_SECONDS = _env_int("RETRY_AFTER_SECONDS", 30)
+
+# Автоматический выключатель для запросов к РСОШ
+BREAKER_WINDOW = _env_int("BREAKER_WINDOW", 50)
+BREAKER_MIN_CALLS = _env_int("BREAKER_MIN_CALLS", 20)
+BREAKER_FAILURE_RATE = _env_float("BREAKER_FAILURE_RATE", 0.5)
+BREAKER_SLOW_CALL_RATE = _env_float("BREAKER_SLOW_CALL_RATE", 0.8)
+BREAKER_SLOW_CALL_SECONDS = _env_float("BREAKER_SLOW_CALL_SECONDS", 3.0)
+BREAKER_OPEN_SECONDS = _env_float("BREAKER_OPEN_SECONDS", 30.0)
+BREAKER_HALF_OPEN_PROBES = _env_int("BREAKER_HALF_OPEN_PROBES", 3)
+# Максимум одновременно обрабатываемых /check и пакетных запросов; 0 — без ограничения
+MAX_IN_FLIGHT_CHECKS = _env_int("MAX_IN_FLIGHT_CHECKS", 200)
+# Значение Retry-After для ответов 503 при превышении MAX_IN_FLIGHT_CHECKS
+SHED_RETRY_AFTER_SECONDS = _env_int("SHED_RETRY_AFTER_SECONDS", 1)
+
+# Поэтапные замеры /check: заголовок Server-Timing и трасса по ?debug=1
+TIMING_ENABLED = _env_bool("TIMING_ENABLED", False)
+
+# Отдавать /check заранее сериализованным JSON (orjson, если установлен) без повторной валидации response_model
+PRESERIALIZED_RESPONSES = _env_bool("PRESERIALIZED_RESPONSES", True)
@@ -0,0 +1,78 @@
+"""Перечни олимпиад, учитываемых вузом: загрузка из JSON и индекс с поиском за O(1)"""
+import json
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+_QUOTES_RE = re.compile(r"[\"'«»„“”‟‘’‚‹›`]")
+_SPACES_RE = re.compile(r"\s+")
+_PROGRAMME_RE = re.compile(r"\d{2}\.\d{2}\.\d{2}")
+
+
+class EligibilityRecord(NamedTuple):
+    """Строка перечня олимпиад, по которой диплом учитывается вузом"""
+    name: str
+    profile: str
+    subject: str
+    level: int
+    list_number: int
+    programmes: Tuple[str, ...]
+    # True — programmes перечисляет исключения из «все направления»
+    programmes_excluded: bool
+    programmes_raw: str
+
+    def allows(self, programme: str) -> bool:
+        """Учитывается ли олимпиада для направления подготовки programme"""
+        return (programme in self.programmes) != self.programmes_excluded
+
+
+EligibilityIndex = Dict[Tuple[str, str], EligibilityRecord]
+
+
+@lru_cache(maxsize=4096)
+def normalize(text: str) -> str:
+    """Приводит название/профиль к ключу: без кавычек, регистра и лишних пробелов"""
+    text = _QUOTES_RE.sub("", text.replace("ё", "е").replace("Ё", "Е"))
+    return _SPACES_RE.sub(" ", text).strip().casefold()
+
+
+def _list_number(olympiad: dict) -> str:
+    """Номер в перечне РСОШ: заголовок столбца содержит учебный год («Номер в перечне на 2024/25 учебный год»)"""
+    for column, value in olympiad.items():
+        if column.startswith("Номер в перечне"):
+            return value
+    raise KeyError("Номер в перечне")
+
+
+def make_record(olympiad: dict) -> EligibilityRecord:
+    """Строка перечня в исходном виде (русские заголовки столбцов) → EligibilityRecord.
+
+    Названия, профили и коды направлений повторяются в перечне десятки раз,
+    поэтому строки интернируются и хранятся в памяти в одном экземпляре.
+    """
+    programmes_raw = sys.intern(olympiad["Направления подготовки"])
+    return EligibilityRecord(
+        name=sys.intern(olympiad["Название олимпиады"]),
+        profile=sys.intern(olympiad["Профиль олимпиады"]),
+        subject=sys.intern(olympiad["Профилирующий предмет"]),
+        level=int(olympiad["Уровень олимпиады"]),
+        list_number=int(_list_number(olympiad)),
+        programmes=tuple(sys.intern(code) for code in _PROGRAMME_RE.findall(programmes_raw)),
+        programmes_excluded=programmes_raw.strip().lower().startswith("все"),
+        programmes_raw=programmes_raw,
+    )
+
+
+def load_records(path: str) -> Tuple[EligibilityRecord, ...]:
+    """Читает перечень из JSON-файла: список строк с заголовками столбцов как в исходной таблице"""
+    with open(path, encoding="utf-8") as data:
+        return tuple(make_record(olympiad) for olympiad in json.load(data))
+
+
+def build_index(records: Iterable[EligibilityRecord]) -> EligibilityIndex:
+    return {(normalize(record.name), normalize(record.profile)): record for record in records}
+
+
+def lookup(index: EligibilityIndex, olympiad_name: str, speciality: str) -> Optional[EligibilityRecord]:
+    return index.get((normalize(olympiad_name), normalize(speciality)))
@@ -0,0 +1,215 @@
+"""Перечни олимпиад по вузам и учебным годам с перезагрузкой без перезапуска.
+
+Файлы лежат в ELIGIBILITY_DIR/{вуз}/{учебный год}.json, например mai/2024-25.json.
+Версия перечня — хэш содержимого файла. Фоновая задача раз в
+ELIGIBILITY_RELOAD_INTERVAL секунд сверяет время изменения файлов; изменённые
+перечни читаются и индексируются в отдельном потоке, затем весь набор подменяется
+одним присваиванием LISTS. Проверки, уже взявшие перечень, дорабатывают со старой
+версией. Файл с ошибкой не заменяет загруженную ранее версию.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .config import ELIGIBILITY_ACADEMIC_YEARS, ELIGIBILITY_DIR, ELIGIBILITY_RELOAD_INTERVAL
+from .eligibility import EligibilityIndex, EligibilityRecord, build_index, lookup, make_record
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownUniversityError(ValueError):
+    """Для вуза не загружено ни одного перечня"""
+
+
+class EligibilityList(NamedTuple):
+    university: str
+    academic_year: str
+    # Первые 12 символов sha256 содержимого файла
+    version: str
+    path: str
+    mtime: float
+    records: Tuple[EligibilityRecord, ...]
+    index: EligibilityIndex
+    loaded_at: float
+
+    def find(self, olympiad_name: str, speciality: str) -> Optional[EligibilityRecord]:
+        return lookup(self.index, olympiad_name, speciality)
+
+
+# (вуз, учебный год) -> перечень; словарь не изменяется, а заменяется целиком
+LISTS: Dict[Tuple[str, str], EligibilityList] = {}
+# вуз -> перечень за последний учебный год; пересчитывается вместе с LISTS
+LATEST: Dict[str, EligibilityList] = {}
+LAST_RELOAD_AT: Optional[float] = None
+# Вызываются с версией перечня, которая заменена новой или удалена
+_ON_REPLACED: List[Callable[[EligibilityList], None]] = []
+_RELOAD_LOCK: Optional[asyncio.Lock] = None
+_RELOADER: Optional[asyncio.Task] = None
+
+
+def on_replaced(callback: Callable[[EligibilityList], None]):
+    _ON_REPLACED.append(callback)
+
+
+def load_list(university: str, academic_year: str, path: str) -> EligibilityList:
+    mtime = os.path.getmtime(path)
+    with open(path, "rb") as data:
+        content = data.read()
+    records = tuple(make_record(olympiad) for olympiad in json.loads(content))
+    return EligibilityList(
+        university=university,
+        academic_year=academic_year,
+        version=hashlib.sha256(content).hexdigest()[:12],
+        path=path,
+        mtime=mtime,
+        records=records,
+        index=build_index(records),
+        loaded_at=time.time(),
+    )
+
+
+def list_files(directory: str = ELIGIBILITY_DIR) -> Dict[Tuple[str, str], str]:
+    files = {}
+    if not os.path.isdir(directory):
+        return files
+    for university in sorted(os.listdir(directory)):
+        university_dir = os.path.join(directory, university)
+        if not os.path.isdir(university_dir):
+            continue
+        for filename in sorted(os.listdir(university_dir)):
+            academic_year, ext = os.path.splitext(filename)
+            if ext == ".json":
+                files[(university, academic_year)] = os.path.join(university_dir, filename)
+    return files
+
+
+def load_lists(current: Dict[Tuple[str, str], EligibilityList]) -> Dict[Tuple[str, str], EligibilityList]:
+    """Новый набор перечней: неизменённые файлы берутся из current, остальные читаются заново"""
+    lists = {}
+    for key, path in list_files().items():
+        old = current.get(key)
+        try:
+            if old is not None and old.path == path and old.mtime == os.path.getmtime(path):
+                lists[key] = old
+                continue
+            new = load_list(*key, path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Failed to load eligibility list {path}: {e}")
+            if old is not None:
+                lists[key] = old
+            continue
+        # Файл переписан без изменений — прежняя версия и её кэши остаются в силе
+        lists[key] = old._replace(mtime=new.mtime) if old is not None and old.version == new.version else new
+    return lists
+
+
+def _swap(lists: Dict[Tuple[str, str], EligibilityList]) -> List[EligibilityList]:
+    global LISTS, LATEST, LAST_RELOAD_AT
+    latest = {}
+    for (university, _), item in sorted(lists.items()):
+        latest[university] = item
+    old, LISTS, LATEST = LISTS, lists, latest
+    LAST_RELOAD_AT = time.time()
+    replaced = [previous for key, previous in old.items() if key not in lists or lists[key].version != previous.version]
+    for previous in replaced:
+        current = lists.get((previous.university, previous.academic_year))
+        if current is None:
+            logger.info(f"Eligibility list {previous.university}/{previous.academic_year} removed")
+        else:
+            logger.info(
+                f"Eligibility list {previous.university}/{previous.academic_year} "
+                f"updated {previous.version} -> {current.version}"
+            )
+        for callback in _ON_REPLACED:
+            callback(previous)
+    return [current for key, current in lists.items() if key not in old or old[key].version != current.version]
+
+
+def ensure_loaded():
+    """Синхронная загрузка при первом обращении вне запущенного приложения"""
+    if not LISTS:
+        _swap(load_lists({}))
+
+
+async def reload_lists() -> List[EligibilityList]:
+    """Перечитывает изменённые файлы вне цикла событий; возвращает новые и обновлённые перечни"""
+    global _RELOAD_LOCK
+    if _RELOAD_LOCK is None:
+        _RELOAD_LOCK = asyncio.Lock()
+    async with _RELOAD_LOCK:
+        lists = await asyncio.to_thread(load_lists, LISTS)
+        return _swap(lists)
+
+
+def get_list(university: str, academic_year: str = "") -> Optional[EligibilityList]:
+    """Перечень вуза за учебный год; без года — за последний из загруженных"""
+    if not LISTS:
+        ensure_loaded()
+    if academic_year:
+        return LISTS.get((university, academic_year))
+    return LATEST.get(university)
+
+
+def active_list(university: str) -> Optional[EligibilityList]:
+    """Действующий перечень вуза: учебный год из ELIGIBILITY_ACADEMIC_YEARS или последний"""
+    return get_list(university, ELIGIBILITY_ACADEMIC_YEARS.get(university, ""))
+
+
+def active_lists(universities: Optional[List[str]] = None) -> List[EligibilityList]:
+    """Действующие перечни перечисленных вузов, по умолчанию — всех зарегистрированных"""
+    if not LISTS:
+        ensure_loaded()
+    lists = []
+    for university in universities or sorted(LATEST):
+        eligibility = active_list(university)
+        if eligibility is None:
+            raise UnknownUniversityError(f"No eligibility list for {university!r}")
+        lists.append(eligibility)
+    return lists
+
+
+async def _reload_loop():
+    while True:
+        await asyncio.sleep(ELIGIBILITY_RELOAD_INTERVAL)
+        try:
+            await reload_lists()
+        except Exception as e:
+            logger.exception(f"Eligibility reload failed: {e}")
+
+
+async def start_eligibility_reloader():
+    """Загружает перечни при запуске приложения и следит за изменениями файлов"""
+    global _RELOADER
+    await reload_lists()
+    if ELIGIBILITY_RELOAD_INTERVAL > 0 and _RELOADER is None:
+        _RELOADER = asyncio.create_task(_reload_loop())
+
+
+async def stop_eligibility_reloader():
+    global _RELOADER
+    if _RELOADER is not None:
+        _RELOADER.cancel()
+        await asyncio.gather(_RELOADER, return_exceptions=True)
+        _RELOADER = None
+
+
+def lists_status() -> dict:
+    return {
+        "lists": [
+            {
+                "university": item.university,
+                "academic_year": item.academic_year,
+                "version": item.version,
+                "records": len(item.records),
+                "path": item.path,
+                "loaded_at": datetime.fromtimestamp(item.loaded_at).isoformat(),
+            }
+            for item in LISTS.values()
+        ],
+        "last_reload_at": datetime.fromtimestamp(LAST_RELOAD_AT).isoformat() if LAST_RELOAD_AT else None,
+    }
@@ -0,0 +1,79 @@
+"""Долгоживущий httpx.AsyncClient, общий для всех запросов к РСОШ"""
+import asyncio
+import importlib.util
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .config import (
+    HTTP2_ENABLED,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_MAX_REQUESTS_PER_HOST,
+    HTTP_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_HOST_SEMAPHORES: Dict[str, asyncio.Semaphore] = {}
+
+
+def create_http_client() -> httpx.AsyncClient:
+    http2 = HTTP2_ENABLED
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP2_ENABLED is set but the h2 package is not installed, using HTTP/1.1")
+        http2 = False
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=HTTP_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+async def init_http_client():
+    """Создаёт общий клиент при запуске приложения"""
+    global HTTP_CLIENT
+    if HTTP_CLIENT is None:
+        HTTP_CLIENT = create_http_client()
+
+
+async def close_http_client():
+    """Закрывает общий клиент и его пул соединений при остановке приложения"""
+    global HTTP_CLIENT
+    if HTTP_CLIENT is not None:
+        await HTTP_CLIENT.aclose()
+        HTTP_CLIENT = None
+    _HOST_SEMAPHORES.clear()
+
+
+@asynccontextmanager
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Отдаёт общий клиент, а вне приложения (скрипты) — временный"""
+    if HTTP_CLIENT is not None:
+        yield HTTP_CLIENT
+        return
+    async with create_http_client() as client:
+        yield client
+
+
+@asynccontextmanager
+async def host_slot(url: str) -> AsyncIterator[None]:
+    """Ограничивает число одновременных запросов к хосту из url"""
+    if HTTP_MAX_REQUESTS_PER_HOST <= 0:
+        yield
+        return
+    host = urlsplit(url).netloc
+    semaphore = _HOST_SEMAPHORES.get(host)
+    if semaphore is None:
+        semaphore = _HOST_SEMAPHORES[host] = asyncio.Semaphore(HTTP_MAX_REQUESTS_PER_HOST)
+    async with semaphore:
+        yield
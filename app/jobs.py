@@ -0,0 +1,268 @@
+"""Фоновые задания пакетной проверки по загруженным CSV/XLSX-файлам.
+
+Файл разбирается в список Person, задание ставится в очередь и обрабатывается
+одним из JOB_WORKERS фоновых воркеров через iter_batch. Результат пишется во
+временный CSV по мере готовности и отдаётся на скачивание.
+"""
+import asyncio
+import csv
+import io
+import logging
+import os
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from .config import JOB_MAX_ROWS, JOB_RETENTION, JOB_WORKERS
+from .models import JobStatus, Person
+from .service import iter_batch
+
+logger = logging.getLogger(__name__)
+
+try:
+    import openpyxl
+except ImportError:  # XLSX поддерживается, только если установлен openpyxl
+    openpyxl = None
+
+# Заголовки столбцов, которые сопоставляются с полями Person
+COLUMN_ALIASES = {
+    "lastname": "lastname", "фамилия": "lastname",
+    "firstname": "firstname", "имя": "firstname",
+    "middlename": "middlename", "отчество": "middlename",
+    "birthdate": "birthdate", "дата рождения": "birthdate", "дата_рождения": "birthdate",
+}
+_DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y")
+
+RESULT_COLUMNS = [
+    "row", "lastname", "firstname", "middlename", "birthdate", "status", "year", "form", "oa",
+    "olympiad_number", "olympiad_name", "olympiad_profile", "olympiad_level", "diploma_degree", "link", "error",
+]
+
+
+class JobInputError(ValueError):
+    """Загруженный файл не удалось разобрать в список персон"""
+
+
+def _parse_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized date {text!r}")
+
+
+def _map_header(header: List) -> Dict[str, int]:
+    mapping = {}
+    for position, title in enumerate(header):
+        field = COLUMN_ALIASES.get(str(title or "").strip().lower())
+        if field and field not in mapping:
+            mapping[field] = position
+    missing = [field for field in ("lastname", "firstname", "middlename", "birthdate") if field not in mapping]
+    if missing:
+        raise JobInputError(f"Missing columns: {', '.join(missing)}")
+    return mapping
+
+
+def _read_rows(raw_rows: List[List]) -> Tuple[List[Optional[Person]], List[Optional[str]]]:
+    """Превращает строки таблицы в Person; для невалидных строк возвращает текст ошибки"""
+    if not raw_rows:
+        raise JobInputError("File is empty")
+    mapping = _map_header(raw_rows[0])
+    persons: List[Optional[Person]] = []
+    errors: List[Optional[str]] = []
+    for raw in raw_rows[1:]:
+        if not any(str(cell or "").strip() for cell in raw):
+            continue
+        values = {field: raw[pos] if pos < len(raw) else None for field, pos in mapping.items()}
+        try:
+            values["birthdate"] = _parse_date(values["birthdate"])
+            persons.append(Person(**{k: v.strip() if isinstance(v, str) else v for k, v in values.items()}))
+            errors.append(None)
+        except (ValueError, ValidationError) as e:
+            persons.append(None)
+            errors.append(str(e))
+    if len(persons) > JOB_MAX_ROWS:
+        raise JobInputError(f"File has {len(persons)} rows, limit is {JOB_MAX_ROWS}")
+    return persons, errors
+
+
+def _decode_text(content: bytes) -> str:
+    for encoding in ("utf-8-sig", "cp1251"):
+        try:
+            return content.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise JobInputError("CSV must be UTF-8 or Windows-1251 encoded")
+
+
+def parse_csv(content: bytes) -> Tuple[List[Optional[Person]], List[Optional[str]]]:
+    text = _decode_text(content)
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    return _read_rows(list(csv.reader(io.StringIO(text), dialect)))
+
+
+def parse_xlsx(content: bytes) -> Tuple[List[Optional[Person]], List[Optional[str]]]:
+    if openpyxl is None:
+        raise JobInputError("XLSX upload requires openpyxl to be installed")
+    try:
+        workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    except Exception as e:
+        raise JobInputError(f"Failed to read XLSX: {e}") from None
+    try:
+        rows = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+    finally:
+        workbook.close()
+    return _read_rows(rows)
+
+
+def parse_upload(filename: str, content: bytes) -> Tuple[List[Optional[Person]], List[Optional[str]]]:
+    if filename.lower().endswith(".xlsx"):
+        return parse_xlsx(content)
+    return parse_csv(content)
+
+
+class Job:
+    def __init__(self, filename: str, persons: List[Optional[Person]], errors: List[Optional[str]]):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.persons = persons
+        self.errors = errors
+        self.total = len(persons)
+        self.status = "queued"
+        self.processed = 0
+        self.found = 0
+        self.failed = 0
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.result_path: Optional[str] = None
+
+    def to_status(self) -> JobStatus:
+        return JobStatus(
+            id=self.id,
+            filename=self.filename,
+            status=self.status,
+            total=self.total,
+            processed=self.processed,
+            found=self.found,
+            failed=self.failed,
+            error=self.error,
+            created_at=datetime.fromtimestamp(self.created_at),
+            finished_at=datetime.fromtimestamp(self.finished_at) if self.finished_at else None,
+        )
+
+    def discard(self):
+        if self.result_path and os.path.exists(self.result_path):
+            os.remove(self.result_path)
+
+
+JOBS: "OrderedDict[str, Job]" = OrderedDict()
+_QUEUE: Optional[asyncio.Queue] = None
+_WORKERS: List[asyncio.Task] = []
+
+
+async def submit_job(filename: str, content: bytes) -> Job:
+    """Разбирает файл и ставит задание в очередь; старые завершённые задания вытесняются"""
+    if _QUEUE is None:
+        raise RuntimeError("Job workers are not running")
+    persons, errors = await asyncio.to_thread(parse_upload, filename, content)
+    job = Job(filename, persons, errors)
+    JOBS[job.id] = job
+    while len(JOBS) > JOB_RETENTION:
+        oldest = next((j for j in JOBS.values() if j.status in ("done", "failed")), None)
+        if oldest is None:
+            break
+        JOBS.pop(oldest.id).discard()
+    _QUEUE.put_nowait(job)
+    return job
+
+
+def get_job(job_id: str) -> Optional[Job]:
+    return JOBS.get(job_id)
+
+
+def _person_cells(person: Optional[Person]) -> List:
+    if person is None:
+        return ["", "", "", ""]
+    return [person.lastname, person.firstname, person.middlename, person.birthdate.isoformat()]
+
+
+async def run_job(job: Job):
+    job.status = "running"
+    fd, job.result_path = tempfile.mkstemp(prefix=f"job-{job.id}-", suffix=".csv")
+    with open(fd, "w", newline="", encoding="utf-8-sig") as output:
+        writer = csv.writer(output)
+        writer.writerow(RESULT_COLUMNS)
+        for row, (person, error) in enumerate(zip(job.persons, job.errors), start=1):
+            if person is None:
+                writer.writerow([row, *_person_cells(None), "error", *[""] * 9, error])
+                job.processed += 1
+                job.failed += 1
+        valid = [(row, person) for row, person in enumerate(job.persons, start=1) if person is not None]
+        async for result in iter_batch([person for _, person in valid]):
+            row, person = valid[result.index]
+            cells = [row, *_person_cells(person), result.status]
+            if result.diplomas:
+                for diploma in result.diplomas:
+                    writer.writerow([
+                        *cells, diploma.year, diploma.form, diploma.oa,
+                        diploma.olympiad_number, diploma.olympiad_name, diploma.olympiad_profile,
+                        diploma.olympiad_level, diploma.diploma_degree, diploma.link, "",
+                    ])
+            else:
+                writer.writerow([*cells, *[""] * 9, result.error or ""])
+            job.processed += 1
+            job.found += result.status == "found"
+            job.failed += result.status == "error"
+    # Входные данные больше не нужны, результат уже на диске
+    job.persons = []
+    job.errors = []
+    job.status = "done"
+
+
+async def _worker():
+    while True:
+        job = await _QUEUE.get()
+        try:
+            await run_job(job)
+        except Exception as e:
+            logger.exception(f"Job {job.id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            _QUEUE.task_done()
+
+
+async def start_job_workers():
+    """Запускает пул воркеров заданий при старте приложения"""
+    global _QUEUE
+    if _QUEUE is None:
+        _QUEUE = asyncio.Queue()
+        _WORKERS.extend(asyncio.create_task(_worker()) for _ in range(JOB_WORKERS))
+
+
+async def stop_job_workers():
+    global _QUEUE
+    for task in _WORKERS:
+        task.cancel()
+    await asyncio.gather(*_WORKERS, return_exceptions=True)
+    _WORKERS.clear()
+    _QUEUE = None
+    for job in JOBS.values():
+        job.discard()
+    JOBS.clear()
@@ -0,0 +1,256 @@
+"""Разбор файлов codes.js без запуска JS-интерпретатора.
+
+Файл codes.js со статического хранилища РСОШ содержит единственное присваивание
+вида ``var diplomaCodes = [...];`` с литералом массива объектов. Модуль понимает
+подмножество грамматики JS, достаточное для таких литералов: массивы, объекты,
+строки в одинарных и двойных кавычках, числа, ``true``/``false``/``null``/``undefined``
+и комментарии. Результат совпадает с тем, что возвращал ``js2py``
+(``context.diplomaCodes.to_list()``).
+"""
+import json
+import re
+
+__all__ = ["JSParseError", "parse_diploma_codes"]
+
+
+class JSParseError(ValueError):
+    """Входной текст не укладывается в поддерживаемую грамматику codes.js"""
+
+
+_PREFIX_RE = re.compile(r"(?:(?:var|let|const)\s+)?diplomaCodes\s*=\s*")
+_WS_RE = re.compile("(?:\\s+|//[^\n\r\u2028\u2029]*|/\\*.*?\\*/)*", re.DOTALL)
+_IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+_NUMBER_RE = re.compile(
+    r"[+-]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+)
+_PLAIN_STR_RE = {
+    '"': re.compile(r'[^"\\\n\r]*'),
+    "'": re.compile(r"[^'\\\n\r]*"),
+}
+_SIMPLE_ESCAPES = {
+    "n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0",
+}
+_LOW_SURROGATE_RE = re.compile(r"\\u([dD][c-fC-F][0-9a-fA-F]{2})")
+_LITERALS = {"true": True, "false": False, "null": None, "undefined": None}
+
+# Все числа в JS — double; js2py отдаёт целые значения как int
+_MAX_EXACT_INT_DIGITS = 15
+
+
+def _js_number(value: float):
+    if value != value or value in (float("inf"), float("-inf")):
+        raise JSParseError("Non-finite numbers are not supported")
+    if value.is_integer():
+        return int(value)
+    return value
+
+
+def _json_int(text: str):
+    if len(text.lstrip("-")) <= _MAX_EXACT_INT_DIGITS:
+        return int(text)
+    return _js_number(float(text))
+
+
+def _json_float(text: str):
+    return _js_number(float(text))
+
+
+def _reject_constant(name: str):
+    raise JSParseError(f"Unsupported constant {name}")
+
+
+_JSON_DECODER = json.JSONDecoder(
+    parse_int=_json_int,
+    parse_float=_json_float,
+    parse_constant=_reject_constant,
+)
+
+
+class _Parser:
+    """Рекурсивный спуск по литералу JS-значения"""
+
+    __slots__ = ("text", "pos")
+
+    def __init__(self, text: str, pos: int = 0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message: str) -> JSParseError:
+        return JSParseError(f"{message} at position {self.pos}")
+
+    def skip(self):
+        self.pos = _WS_RE.match(self.text, self.pos).end()
+
+    def peek(self) -> str:
+        self.skip()
+        return self.text[self.pos:self.pos + 1]
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def value(self):
+        char = self.peek()
+        if char == "[":
+            return self.array()
+        if char == "{":
+            return self.object()
+        if char in ('"', "'"):
+            return self.string()
+        match = _NUMBER_RE.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            return self.number(match.group())
+        match = _IDENT_RE.match(self.text, self.pos)
+        if match and match.group() in _LITERALS:
+            self.pos = match.end()
+            return _LITERALS[match.group()]
+        raise self.error("Unexpected token")
+
+    def array(self) -> list:
+        self.pos += 1
+        items = []
+        while True:
+            char = self.peek()
+            if char == "]":
+                self.pos += 1
+                return items
+            if char == ",":
+                raise self.error("Array holes are not supported")
+            items.append(self.value())
+            if self.peek() == ",":
+                self.pos += 1
+            elif self.peek() != "]":
+                raise self.error("Expected ',' or ']'")
+
+    def object(self) -> dict:
+        self.pos += 1
+        result = {}
+        while True:
+            char = self.peek()
+            if char == "}":
+                self.pos += 1
+                return result
+            key = self.key()
+            self.expect(":")
+            result[key] = self.value()
+            if self.peek() == ",":
+                self.pos += 1
+            elif self.peek() != "}":
+                raise self.error("Expected ',' or '}'")
+
+    def key(self) -> str:
+        char = self.peek()
+        if char in ('"', "'"):
+            return self.string()
+        match = _IDENT_RE.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            return match.group()
+        match = _NUMBER_RE.match(self.text, self.pos)
+        if match and match.group()[0] not in "+-":
+            self.pos = match.end()
+            number = self.number(match.group())
+            return repr(number) if isinstance(number, float) else str(number)
+        raise self.error("Expected property name")
+
+    def number(self, token: str):
+        sign = -1 if token[0] == "-" else 1
+        body = token.lstrip("+-")
+        if body[:2] in ("0x", "0X"):
+            return sign * int(body, 16)
+        if len(body) > 1 and body[0] == "0" and body[1].isdigit():
+            raise self.error("Legacy octal literals are not supported")
+        if body.isdigit() and len(body) <= _MAX_EXACT_INT_DIGITS:
+            return sign * int(body)
+        return _js_number(sign * float(body))
+
+    def string(self) -> str:
+        text = self.text
+        quote = text[self.pos]
+        plain = _PLAIN_STR_RE[quote]
+        self.pos += 1
+        chunks = []
+        while True:
+            end = plain.match(text, self.pos).end()
+            chunks.append(text[self.pos:end])
+            self.pos = end
+            char = text[end:end + 1]
+            if char == quote:
+                self.pos += 1
+                return "".join(chunks)
+            if char != "\\":
+                raise self.error("Unterminated string")
+            chunks.append(self.escape())
+
+    def escape(self) -> str:
+        text = self.text
+        char = text[self.pos + 1:self.pos + 2]
+        self.pos += 2
+        if char in _SIMPLE_ESCAPES:
+            if char == "0" and text[self.pos:self.pos + 1].isdigit():
+                raise self.error("Octal escapes are not supported")
+            return _SIMPLE_ESCAPES[char]
+        if char == "x":
+            return self.hex_escape(2)
+        if char == "u":
+            return self.unicode_escape()
+        if char == "\r":
+            if text[self.pos:self.pos + 1] == "\n":
+                self.pos += 1
+            return ""
+        if char in ("\n", "\u2028", "\u2029"):
+            return ""
+        if char == "" or char.isdigit():
+            raise self.error("Bad escape sequence")
+        return char
+
+    def hex_escape(self, size: int) -> str:
+        digits = self.text[self.pos:self.pos + size]
+        if len(digits) != size or not all(c in "0123456789abcdefABCDEF" for c in digits):
+            raise self.error("Bad hex escape")
+        self.pos += size
+        return chr(int(digits, 16))
+
+    def unicode_escape(self) -> str:
+        """\\uXXXX; экранированная суррогатная пара склеивается в один символ, как в json"""
+        char = self.hex_escape(4)
+        if "\ud800" <= char <= "\udbff":
+            low = _LOW_SURROGATE_RE.match(self.text, self.pos)
+            if low:
+                self.pos = low.end()
+                return chr(0x10000 + (ord(char) - 0xD800 << 10) + int(low.group(1), 16) - 0xDC00)
+        return char
+
+
+def _parse_value(text: str, pos: int):
+    """Сначала пробует C-реализацию json, затем собственный разбор JS-литерала"""
+    try:
+        return _JSON_DECODER.raw_decode(text, pos)
+    except ValueError:
+        pass
+    parser = _Parser(text, pos)
+    value = parser.value()
+    return value, parser.pos
+
+
+def parse_diploma_codes(js_text: str) -> list[dict]:
+    """Возвращает значение массива diplomaCodes из текста codes.js.
+
+    Бросает JSParseError, если файл содержит что-либо кроме одного присваивания
+    литерала массива.
+    """
+    pos = _WS_RE.match(js_text).end()
+    prefix = _PREFIX_RE.match(js_text, pos)
+    if not prefix:
+        raise JSParseError("diplomaCodes assignment not found")
+    value, pos = _parse_value(js_text, prefix.end())
+    if not isinstance(value, list):
+        raise JSParseError("diplomaCodes is not an array")
+    pos = _WS_RE.match(js_text, pos).end()
+    if js_text.startswith(";", pos):
+        pos = _WS_RE.match(js_text, pos + 1).end()
+    if pos != len(js_text):
+        raise JSParseError(f"Unexpected trailing content at position {pos}")
+    return value
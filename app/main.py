@@ -1,11 +1,36 @@
 import logging
 import asyncio
-from fastapi import FastAPI
+import math
+import secrets
+from typing import Optional
+from fastapi import Depends, FastAPI, File, Header, Query, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from app.models import Person, DiplomaData
-from app.service import get_diplomas_data
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from app.models import DIPLOMA_LIST, BatchCheckResult, JobStatus, Person, DiplomaData, UniversitiesCheckResult
+from app.service import check_batch, check_universities, iter_batch, get_annotated_diplomas, get_diplomas_data, invalidate_cached_result, flush_cached_results, cache_stats, coalescing_stats
+from app.service import PERSON_FLIGHTS, RESULT_CACHE, YEAR_CACHE, YEAR_FLIGHTS
+from app import metrics, tracing
+from app.config import (
+    ADMIN_TOKEN,
+    BATCH_MAX_SIZE,
+    PRESERIALIZED_RESPONSES,
+    RETRY_AFTER_SECONDS,
+    SHED_RETRY_AFTER_SECONDS,
+    TIMING_ENABLED,
+)
+from app.utils import DECODE_STATS
+from app.resilience import CHECK_SHEDDER, UPSTREAM_BREAKER
 from fastapi import HTTPException
-from .service import init_olympiads_lookup
+from .eligibility_lists import UnknownUniversityError, lists_status, reload_lists, start_eligibility_reloader, stop_eligibility_reloader
+from .http_client import init_http_client, close_http_client
+from .store import init_store, close_store
+from .availability import start_storage_prober, stop_storage_prober, storage_status
+from .jobs import JobInputError, get_job, start_job_workers, stop_job_workers, submit_job
+
+try:
+    import orjson
+except ImportError:  # без orjson список сериализуется средствами pydantic
+    orjson = None
 
 app = FastAPI(
     title="Проверка дипломов РСОШ",
@@ -17,6 +42,28 @@ app = FastAPI(
     }
 )
 
+class LoadSheddingMiddleware:
+    """Сразу отвечает 503 на /check*, если одновременно обрабатывается больше MAX_IN_FLIGHT_CHECKS"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/check"):
+            await self.app(scope, receive, send)
+            return
+        if not CHECK_SHEDDER.try_acquire():
+            response = JSONResponse(
+                {"detail": "Too many checks in progress"}, status_code=503, headers={"Retry-After": str(SHED_RETRY_AFTER_SECONDS)}
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            CHECK_SHEDDER.release()
+
+app.add_middleware(LoadSheddingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -26,9 +73,46 @@ app.add_middleware(
 )
 
 logging.basicConfig(level=logging.INFO)
+
+_CACHE_COUNTERS = ("hits", "misses", "evictions", "expirations")
+metrics.register_stats("result_cache", RESULT_CACHE.stats, _CACHE_COUNTERS)
+metrics.register_stats("year_cache", YEAR_CACHE.stats, _CACHE_COUNTERS)
+metrics.register_stats("person_coalescing", PERSON_FLIGHTS.stats, ("leaders", "coalesced"))
+metrics.register_stats("year_coalescing", YEAR_FLIGHTS.stats, ("leaders", "coalesced"))
+metrics.register_stats("decode", lambda: DECODE_STATS, ("utf8", "charset", "detected"))
+metrics.register_stats("breaker", UPSTREAM_BREAKER.stats, ("opened", "rejected"))
+metrics.register_stats("checks", CHECK_SHEDDER.stats, ("shed",))
+
+
+def dump_diplomas(diplomas: list[DiplomaData]) -> bytes:
+    """JSON списка дипломов без повторной валидации: объекты уже собраны из проверенных данных"""
+    if orjson is not None:
+        return orjson.dumps([diploma.__dict__ for diploma in diplomas])
+    return DIPLOMA_LIST.dump_json(diplomas)
+
+
+async def require_admin(x_admin_token: str = Header(default="")):
+    """Без ADMIN_TOKEN /admin/* закрыты: они сбрасывают кэши и постоянное хранилище"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled: ADMIN_TOKEN is not set")
+    if not secrets.compare_digest(x_admin_token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
 @app.on_event("startup")
 async def startup_event():
-    init_olympiads_lookup()
+    await start_eligibility_reloader()
+    await init_http_client()
+    await init_store()
+    await start_job_workers()
+    await start_storage_prober()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await stop_storage_prober()
+    await stop_job_workers()
+    await close_http_client()
+    await close_store()
+    await stop_eligibility_reloader()
 
 @app.get(
     "/health",
@@ -40,6 +124,16 @@ async def startup_event():
 async def health_check():
     return {"status": "ok"}
 
+@app.get(
+    "/metrics",
+    tags=["Service"],
+    summary="Метрики Prometheus",
+    description="Задержки запросов к РСОШ по годам и статусам, время декодирования и разбора codes.js, отброшенные дипломы по причинам, попадания в кэши и число запросов в работе.",
+    response_class=Response
+)
+async def prometheus_metrics():
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE_LATEST)
+
 @app.post(
     "/check",
     tags=["Diplomas"],
@@ -48,12 +142,259 @@ async def health_check():
 Проверяет наличие дипломов на сайте https://diploma.rsr-olymp.ru.
 
 Требуется передать ФИО и дату рождения. Если дипломы найдены, возвращается список с деталями.
+
+Если часть лет получить не удалось, их список передаётся в заголовке `X-Incomplete-Years`;
+если при этом дипломов не найдено, возвращается 503 вместо 404.
+
+При включённом `TIMING_ENABLED` ответ содержит заголовок `Server-Timing` с временем этапов
+по годам, а `?debug=1` возвращает вместо списка JSON с дипломами и полной трассой проверки.
+
+`?annotated=1` возвращает `AnnotatedCheckResult` со статусом 200: все разобранные дипломы
+персоны, в том числе не учтённые, с причиной решения (`reason`) и совпавшей строкой перечня МАИ.
+Ответ строится из кэша дипломов по годам без условных запросов: после `/check` для той же
+персоны обращений к РСОШ нет, запрашиваются только годы, которых ещё нет в кэше.
 """,
     response_description="Список найденных дипломов",
     response_model=list[DiplomaData]
 )
-async def check_diplomas(person: Person):
-    diplomas = await get_diplomas_data(person)
+async def check_diplomas(person: Person, response: Response, debug: bool = False, annotated: bool = False):
+    trace = tracing.start() if TIMING_ENABLED else None
+    if annotated:
+        result = await get_annotated_diplomas(person)
+        diplomas, incomplete_years = result.diplomas, result.incomplete_years
+    else:
+        diplomas, incomplete_years = await get_diplomas_data(person)
+    headers = {}
+    if incomplete_years:
+        headers["X-Incomplete-Years"] = ",".join(map(str, incomplete_years))
+    if trace is not None:
+        headers["Server-Timing"] = trace.server_timing()
+        if debug:
+            return JSONResponse({
+                "diplomas": [diploma.model_dump() for diploma in diplomas],
+                "incomplete_years": incomplete_years,
+                "trace": trace.to_dict(),
+            }, headers=headers)
+    if annotated:
+        return Response(result.model_dump_json(), media_type="application/json", headers=headers)
     if not diplomas:
-        raise HTTPException(status_code=404, detail="No diplomas found")
+        if incomplete_years:
+            headers["Retry-After"] = str(max(RETRY_AFTER_SECONDS, math.ceil(UPSTREAM_BREAKER.retry_after())))
+            raise HTTPException(
+                status_code=503,
+                detail=f"Upstream unavailable for years {', '.join(map(str, incomplete_years))}",
+                headers=headers,
+            )
+        raise HTTPException(status_code=404, detail="No diplomas found", headers=headers or None)
+    if PRESERIALIZED_RESPONSES:
+        return Response(dump_diplomas(diplomas), media_type="application/json", headers=headers)
+    response.headers.update(headers)
     return diplomas
+
+
+@app.post(
+    "/check/universities",
+    tags=["Diplomas"],
+    summary="Проверка дипломов по перечням нескольких вузов",
+    description="""
+Загружает дипломы персоны один раз и сверяет их с действующими перечнями олимпиад
+всех переданных в `university` вузов (по умолчанию — всех, для которых загружены перечни).
+Для каждого вуза возвращается решение и учитываемые им дипломы.
+
+Если часть лет получить не удалось, их список передаётся в `incomplete_years` и в заголовке
+`X-Incomplete-Years`; если при этом ни один вуз не учитывает ни одного диплома, возвращается 503.
+""",
+    response_description="Решения по вузам",
+    response_model=UniversitiesCheckResult
+)
+async def check_diplomas_universities(person: Person, response: Response, university: Optional[list[str]] = Query(None)):
+    try:
+        result = await check_universities(person, university)
+    except UnknownUniversityError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if result.incomplete_years:
+        years = ",".join(map(str, result.incomplete_years))
+        if not any(verdict.eligible for verdict in result.verdicts):
+            raise HTTPException(
+                status_code=503,
+                detail=f"Upstream unavailable for years {', '.join(map(str, result.incomplete_years))}",
+                headers={
+                    "X-Incomplete-Years": years,
+                    "Retry-After": str(max(RETRY_AFTER_SECONDS, math.ceil(UPSTREAM_BREAKER.retry_after()))),
+                },
+            )
+        response.headers["X-Incomplete-Years"] = years
+    return result
+
+@app.post(
+    "/check/batch",
+    tags=["Diplomas"],
+    summary="Пакетная проверка дипломов",
+    description=f"""
+Проверяет список персон за один вызов. Одинаковые персоны проверяются один раз,
+число одновременных проверок ограничено.
+
+Для каждой персоны возвращается результат с её позицией во входном списке (`index`)
+и статусом `found`, `none` или `error`. Максимальный размер пакета — {BATCH_MAX_SIZE} персон.
+""",
+    response_description="Результаты проверки в порядке входного списка",
+    response_model=list[BatchCheckResult]
+)
+async def check_diplomas_batch(persons: list[Person]):
+    if len(persons) > BATCH_MAX_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch size exceeds {BATCH_MAX_SIZE}")
+    return await check_batch(persons)
+
+@app.post(
+    "/check/batch/stream",
+    tags=["Diplomas"],
+    summary="Потоковая пакетная проверка дипломов (NDJSON)",
+    description=f"""
+То же, что `/check/batch`, но результаты отдаются в формате NDJSON: по одной строке
+`BatchCheckResult` на персону сразу после завершения её проверки. Порядок строк не совпадает
+с порядком входного списка — используйте поле `index`. Максимальный размер пакета — {BATCH_MAX_SIZE} персон.
+""",
+    response_description="Поток строк BatchCheckResult в формате NDJSON",
+    response_class=StreamingResponse
+)
+async def check_diplomas_batch_stream(persons: list[Person]):
+    if len(persons) > BATCH_MAX_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch size exceeds {BATCH_MAX_SIZE}")
+
+    async def lines():
+        async for result in iter_batch(persons):
+            yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@app.post(
+    "/jobs",
+    tags=["Jobs"],
+    summary="Загрузка списка персон для фоновой проверки",
+    description="""
+Принимает CSV (UTF-8 или Windows-1251, разделитель `,`, `;` или табуляция) либо XLSX,
+если на сервере установлен `openpyxl`. Первая строка — заголовки: `lastname`, `firstname`,
+`middlename`, `birthdate` или `Фамилия`, `Имя`, `Отчество`, `Дата рождения`.
+Дата — `ГГГГ-ММ-ДД` или `ДД.ММ.ГГГГ`.
+
+Задание выполняется в фоне; прогресс — `GET /jobs/{job_id}`, результат — `GET /jobs/{job_id}/result`.
+""",
+    response_description="Состояние созданного задания",
+    response_model=JobStatus,
+    status_code=202
+)
+async def create_job(file: UploadFile = File(...)):
+    content = await file.read()
+    try:
+        job = await submit_job(file.filename or "upload.csv", content)
+    except JobInputError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return job.to_status()
+
+@app.get(
+    "/jobs/{job_id}",
+    tags=["Jobs"],
+    summary="Прогресс фонового задания",
+    response_model=JobStatus
+)
+async def job_status(job_id: str):
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_status()
+
+@app.get(
+    "/jobs/{job_id}/result",
+    tags=["Jobs"],
+    summary="Скачивание результата фонового задания",
+    description="CSV с одной строкой на каждый найденный диплом (или одной строкой на персону без дипломов).",
+    response_class=FileResponse
+)
+async def job_result(job_id: str):
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return FileResponse(job.result_path, media_type="text/csv", filename=f"result-{job.id}.csv")
+
+@app.get(
+    "/admin/cache",
+    tags=["Admin"],
+    summary="Статистика кэшей",
+    description="Возвращает для кэша результатов и кэша ответов по годам число записей, занятую память и счётчики попаданий, промахов и вытеснений.",
+    dependencies=[Depends(require_admin)]
+)
+async def get_cache_stats():
+    return cache_stats()
+
+@app.get(
+    "/admin/stats",
+    tags=["Admin"],
+    summary="Внутренние счётчики сервиса",
+    description="Статистика кэшей, объединения одновременных запросов, декодирования ответов, состояние автоматического выключателя и число отклонённых из-за перегрузки проверок.",
+    dependencies=[Depends(require_admin)]
+)
+async def get_stats():
+    return {
+        "caches": cache_stats(),
+        "coalescing": coalescing_stats(),
+        "decode": dict(DECODE_STATS),
+        "breaker": UPSTREAM_BREAKER.stats(),
+        "load": CHECK_SHEDDER.stats(),
+    }
+
+@app.get(
+    "/admin/storage-years",
+    tags=["Admin"],
+    summary="Опубликованные годы хранилища РСОШ",
+    description="Годы `compiled-storage-{year}`, которые фоновая проверка нашла доступными и недоступными. Недоступные годы не запрашиваются при проверке и считаются годами без дипломов. **По умолчанию проверка выключена**: она запускается, только если `STORAGE_PROBE_PATH` указывает на файл внутри `compiled-storage-{year}/`, который есть в каждом опубликованном году. До этого запрашиваются все годы, `probing` равно `false`, а списки `available` и `unavailable` всегда пусты.",
+    dependencies=[Depends(require_admin)]
+)
+async def get_storage_years():
+    return storage_status()
+
+@app.get(
+    "/admin/eligibility",
+    tags=["Admin"],
+    summary="Загруженные перечни олимпиад",
+    description="Перечни по вузам и учебным годам из `ELIGIBILITY_DIR` с версией (хэш файла), числом строк и временем загрузки.",
+    dependencies=[Depends(require_admin)]
+)
+async def get_eligibility_lists():
+    return lists_status()
+
+@app.post(
+    "/admin/eligibility/reload",
+    tags=["Admin"],
+    summary="Перечитать перечни олимпиад",
+    description="Сразу перечитывает изменённые файлы перечней, не дожидаясь фоновой проверки. Закэшированные результаты `/check` сбрасываются только для заменённых версий перечней.",
+    dependencies=[Depends(require_admin)]
+)
+async def reload_eligibility_lists():
+    changed = await reload_lists()
+    return {
+        "changed": [
+            {"university": item.university, "academic_year": item.academic_year, "version": item.version}
+            for item in changed
+        ],
+    }
+
+@app.post(
+    "/admin/cache/invalidate",
+    tags=["Admin"],
+    summary="Сброс кэша для одной персоны",
+    description="Удаляет закэшированный результат `/check` для переданных ФИО и даты рождения.",
+    dependencies=[Depends(require_admin)]
+)
+async def invalidate_person(person: Person):
+    return {"invalidated": invalidate_cached_result(person)}
+
+@app.delete(
+    "/admin/cache",
+    tags=["Admin"],
+    summary="Полная очистка кэшей",
+    dependencies=[Depends(require_admin)]
+)
+async def flush_cache():
+    return {"flushed": flush_cached_results()}
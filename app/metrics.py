@@ -0,0 +1,89 @@
+"""Метрики Prometheus для /metrics.
+
+На пути запроса обновляются только гистограммы и счётчики с заранее привязанными
+метками. Состояние кэшей, объединения запросов, выключателя и очереди проверок
+не дублируется: StatsCollector читает уже существующие счётчики при сборе метрик.
+"""
+from typing import Callable, Iterable
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+REGISTRY = CollectorRegistry()
+
+UPSTREAM_FETCH_SECONDS = Histogram(
+    "diploma_upstream_fetch_seconds",
+    "Время запроса codes.js к diploma.rsr-olymp.ru",
+    ["year", "status"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 3, 5, 10),
+    registry=REGISTRY,
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    "diploma_upstream_in_flight",
+    "Запросы к diploma.rsr-olymp.ru, ожидающие ответа",
+    registry=REGISTRY,
+)
+DECODE_SECONDS = Histogram(
+    "diploma_decode_seconds",
+    "Время smart_decode одного ответа",
+    buckets=(1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05),
+    registry=REGISTRY,
+)
+JS_PARSE_SECONDS = Histogram(
+    "diploma_js_parse_seconds",
+    "Время извлечения diplomaCodes из codes.js",
+    buckets=(1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1),
+    registry=REGISTRY,
+)
+DIPLOMAS_FILTERED = Counter(
+    "diploma_filtered_total",
+    "Дипломы, отброшенные при разборе или отборе по перечню, по причине",
+    ["reason"],
+    registry=REGISTRY,
+)
+DIPLOMAS_ACCEPTED = Counter(
+    "diploma_accepted_total",
+    "Дипломы, прошедшие все фильтры (по каждому проверенному перечню)",
+    registry=REGISTRY,
+)
+
+FILTERED_FORM = DIPLOMAS_FILTERED.labels("form")
+FILTERED_MISSING_FIELDS = DIPLOMAS_FILTERED.labels("missing_fields")
+FILTERED_OA_MISMATCH = DIPLOMAS_FILTERED.labels("oa_mismatch")
+FILTERED_NOT_IN_LIST = DIPLOMAS_FILTERED.labels("not_in_list")
+
+
+class StatsCollector:
+    """Отдаёт в Prometheus счётчики, которые сервис уже ведёт в виде словарей stats()"""
+
+    def __init__(self, name: str, stats: Callable[[], dict], counters: Iterable[str] = ()):
+        self.name = name
+        self.stats = stats
+        self.counters = set(counters)
+
+    def collect(self):
+        stats = self.stats()
+        if "hits" in stats and "misses" in stats:
+            lookups = stats["hits"] + stats["misses"]
+            ratio = GaugeMetricFamily(f"diploma_{self.name}_hit_ratio", f"{self.name}: hits / (hits + misses)")
+            ratio.add_metric([], stats["hits"] / lookups if lookups else 0.0)
+            yield ratio
+        for key, value in stats.items():
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            metric = f"diploma_{self.name}_{key}"
+            if key in self.counters:
+                family = CounterMetricFamily(metric, f"{self.name}: {key}")
+            else:
+                family = GaugeMetricFamily(metric, f"{self.name}: {key}")
+            family.add_metric([], value)
+            yield family
+
+
+def register_stats(name: str, stats: Callable[[], dict], counters: Iterable[str] = ()):
+    REGISTRY.register(StatsCollector(name, stats, counters))
+
+
+def render() -> bytes:
+    return generate_latest(REGISTRY)
+
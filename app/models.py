@@ -1,5 +1,8 @@
-from pydantic import BaseModel, Field
-from datetime import date
+from pydantic import BaseModel, Field, TypeAdapter
+from datetime import date, datetime
+from functools import lru_cache
+from typing import List, Literal, Optional
+from .oa_parser import parse_oa
 
 class Person(BaseModel):
     lastname: str = Field(..., example="Гавриченко")
@@ -12,4 +15,84 @@ class DiplomaData(BaseModel):
     oa: str = Field(..., example='№5. "Всероссийская олимпиада школьников по физике", 2 уровень. Диплом 1 степени.')
     link: str = Field(..., example="https://diploma.rsr-olymp.ru/files/rsosh-diplomas-static/compiled-storage-2022/by-code/1234567890/white.pdf")
     form: int = Field(..., example=11)
-    year: int = Field(..., example=2022)
\ No newline at end of file
+    year: int = Field(..., example=2022)
+    # Поля разобранной строки oa; None, если её не удалось разобрать
+    olympiad_number: Optional[int] = Field(None, example=5, description="Номер олимпиады в перечне РСОШ")
+    olympiad_name: Optional[str] = Field(None, example="Всероссийская олимпиада школьников по физике")
+    olympiad_profile: Optional[str] = Field(None, example=None)
+    olympiad_level: Optional[int] = Field(None, example=2)
+    diploma_degree: Optional[int] = Field(None, example=1)
+
+@lru_cache(maxsize=16384)
+def award_fields(oa: str) -> dict:
+    """Поля олимпиады для DiplomaData из строки oa; пустой словарь, если её не удалось разобрать.
+
+    Словарь общий для всех вызовов с той же строкой: только для распаковки в DiplomaData(**...).
+    """
+    award = parse_oa(oa)
+    if award is None:
+        return {}
+    return {
+        "olympiad_number": award.list_number,
+        "olympiad_name": award.name,
+        "olympiad_profile": award.profile,
+        "olympiad_level": award.level,
+        "diploma_degree": award.degree,
+    }
+
+# Сериализация и разбор списков дипломов целиком в pydantic-core, без промежуточных dict
+DIPLOMA_LIST = TypeAdapter(List[DiplomaData])
+
+class BatchCheckResult(BaseModel):
+    index: int = Field(..., example=0, description="Позиция персоны во входном списке")
+    status: Literal["found", "none", "error"] = Field(..., example="found")
+    diplomas: List[DiplomaData] = Field(default_factory=list)
+    incomplete_years: List[int] = Field(default_factory=list, example=[], description="Годы, которые не удалось проверить")
+    error: Optional[str] = Field(None, example=None)
+
+class UniversityVerdict(BaseModel):
+    university: str = Field(..., example="mai")
+    academic_year: str = Field(..., example="2024-25")
+    list_version: str = Field(..., example="2602261631dc", description="Версия перечня олимпиад (хэш файла)")
+    eligible: bool = Field(..., example=True, description="Есть хотя бы один учитываемый вузом диплом")
+    diplomas: List[DiplomaData] = Field(default_factory=list)
+
+class UniversitiesCheckResult(BaseModel):
+    verdicts: List[UniversityVerdict]
+    incomplete_years: List[int] = Field(default_factory=list, example=[], description="Годы, которые не удалось проверить")
+
+class EligibilityMatch(BaseModel):
+    name: str = Field(..., example="Олимпиада школьников «Физтех»")
+    profile: str = Field(..., example="математика")
+    subject: str = Field(..., example="математика")
+    level: int = Field(..., example=1)
+    list_number: int = Field(..., example=56, description="Номер олимпиады в перечне РСОШ")
+    programmes: List[str] = Field(default_factory=list, example=["42.03.01", "45.03.02"])
+    programmes_excluded: bool = Field(..., example=True, description="programmes перечисляет исключения из «все направления»")
+
+class AnnotatedDiploma(DiplomaData):
+    accepted: bool = Field(..., example=False)
+    reason: Optional[Literal["form", "oa_mismatch", "not_in_list"]] = Field(
+        None, example="not_in_list",
+        description="Почему диплом не учтён: класс не 10–11, не разобрана строка oa, олимпиады нет в перечне",
+    )
+    olympiad: Optional[EligibilityMatch] = Field(None, description="Строка перечня, с которой совпал диплом")
+
+class AnnotatedCheckResult(BaseModel):
+    university: str = Field(..., example="mai")
+    academic_year: str = Field(..., example="2024-25")
+    list_version: str = Field(..., example="2602261631dc")
+    diplomas: List[AnnotatedDiploma] = Field(default_factory=list)
+    incomplete_years: List[int] = Field(default_factory=list, example=[], description="Годы, которые не удалось проверить")
+
+class JobStatus(BaseModel):
+    id: str = Field(..., example="9f1c2e4b7a0d4c1e8b5a3f6d2c7e9a10")
+    filename: str = Field(..., example="applicants.csv")
+    status: Literal["queued", "running", "done", "failed"] = Field(..., example="running")
+    total: int = Field(..., example=1500)
+    processed: int = Field(..., example=420)
+    found: int = Field(..., example=37)
+    failed: int = Field(..., example=2)
+    error: Optional[str] = Field(None, example=None)
+    created_at: datetime
+    finished_at: Optional[datetime] = None
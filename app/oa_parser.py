@@ -0,0 +1,79 @@
+"""Разбор строки oa диплома РСОШ в типизированную запись.
+
+Обычный вид строки::
+
+    №73. "Пироговская олимпиада школьников по химии и биологии" (профиль "биология"), 2 уровень. Диплом 2 степени.
+
+Сначала пробуется строгое регулярное выражение для этого вида, затем более
+терпимые варианты: без профиля, с кавычками внутри названия, с «ёлочками»,
+римскими цифрами и без точек. Строки oa повторяются у тысяч участников,
+поэтому результат запоминается для каждой различной строки.
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+__all__ = ["OA_PATTERN", "OlympiadAward", "parse_oa"]
+
+logger = logging.getLogger(__name__)
+
+OA_PATTERN = re.compile(
+    r'№(\d+)\.\s*"([^"]+)"\s*\([^"]*"([^"]+)"[^)]*\),\s*(\d+)\s*уровень\.\s*Диплом\s*(\d+)\s*степени\.'
+)
+
+# Без профиля: №5. "Всероссийская олимпиада школьников по физике", 2 уровень. Диплом 1 степени.
+_NO_PROFILE_RE = re.compile(
+    r'№(\d+)\.\s*"([^"]+)"\s*,\s*(\d+)\s*уровень\.\s*Диплом\s*(\d+)\s*степени\.'
+)
+
+# Всё остальное: название с кавычками внутри, «ёлочки», римские цифры, пропущенные точки и запятые
+_TOLERANT_RE = re.compile(
+    r'№\s*(?P<number>\d+)\s*\.?\s*'
+    r'["«](?P<name>.+?)["»]'
+    r'(?:\s*\((?:[^"«)]*)["«](?P<profile>[^"»]+)["»][^)]*\))?'
+    r'\s*,?\s*(?P<level>\d+|[IV]+)\s*уровень\.?'
+    r'\s*Диплом\s*(?P<degree>\d+|[IV]+)\s*степени',
+    re.IGNORECASE,
+)
+
+_ROMAN = {"I": 1, "II": 2, "III": 3, "IV": 4}
+
+
+class OlympiadAward(NamedTuple):
+    list_number: int
+    name: str
+    profile: Optional[str]
+    level: int
+    degree: int
+
+
+def _number(text: str) -> int:
+    return int(text) if text.isdigit() else _ROMAN[text.upper()]
+
+
+@lru_cache(maxsize=16384)
+def parse_oa(oa: str) -> Optional[OlympiadAward]:
+    """Номер в перечне, олимпиада, профиль, уровень и степень диплома; None, если строку не разобрать"""
+    match = OA_PATTERN.match(oa)
+    if match:
+        number, name, profile, level, degree = match.groups()
+        return OlympiadAward(int(number), name, profile, int(level), int(degree))
+    match = _NO_PROFILE_RE.match(oa)
+    if match:
+        number, name, level, degree = match.groups()
+        return OlympiadAward(int(number), name, None, int(level), int(degree))
+    match = _TOLERANT_RE.search(oa)
+    if match:
+        try:
+            return OlympiadAward(
+                int(match["number"]),
+                match["name"].strip(),
+                match["profile"].strip() if match["profile"] else None,
+                _number(match["level"]),
+                _number(match["degree"]),
+            )
+        except KeyError:
+            pass
+    logger.warning(f"Failed to parse oa string: {oa}")
+    return None
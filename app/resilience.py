@@ -0,0 +1,232 @@
+"""Повторы, хеджирование, автоматический выключатель и сброс нагрузки для запросов к РСОШ"""
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Tuple, TypeVar
+
+from .config import (
+    BREAKER_FAILURE_RATE,
+    BREAKER_HALF_OPEN_PROBES,
+    BREAKER_MIN_CALLS,
+    BREAKER_OPEN_SECONDS,
+    BREAKER_SLOW_CALL_RATE,
+    BREAKER_SLOW_CALL_SECONDS,
+    BREAKER_WINDOW,
+    HEDGE_DEFAULT_DELAY,
+    HEDGE_ENABLED,
+    HEDGE_MIN_DELAY,
+    MAX_IN_FLIGHT_CHECKS,
+    UPSTREAM_RETRIES,
+    UPSTREAM_RETRY_BASE_DELAY,
+)
+
+T = TypeVar("T")
+
+
+class UpstreamError(Exception):
+    """Год не удалось получить или разобрать; результат проверки неполон"""
+
+
+class TransientUpstreamError(UpstreamError):
+    """Ошибка, которую имеет смысл повторить: сеть, таймаут, 429, 5xx"""
+
+
+class LatencyTracker:
+    """Скользящее окно задержек успешных запросов для оценки p95"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._p95: Optional[float] = None
+        self._since_update = 0
+
+    def observe(self, seconds: float):
+        self._samples.append(seconds)
+        self._since_update += 1
+        if self._since_update >= 10:
+            self._since_update = 0
+            self._p95 = None
+
+    def p95(self) -> Optional[float]:
+        if len(self._samples) < self._min_samples:
+            return None
+        if self._p95 is None:
+            ordered = sorted(self._samples)
+            self._p95 = ordered[int(len(ordered) * 0.95) - 1]
+        return self._p95
+
+
+UPSTREAM_LATENCY = LatencyTracker()
+
+
+def hedge_delay() -> float:
+    p95 = UPSTREAM_LATENCY.p95()
+    return HEDGE_DEFAULT_DELAY if p95 is None else max(HEDGE_MIN_DELAY, p95)
+
+
+async def with_retries(fn: Callable[[], Awaitable[T]], retries: int = UPSTREAM_RETRIES) -> T:
+    """Повторяет fn при TransientUpstreamError с экспоненциальной задержкой и полным джиттером"""
+    for attempt in range(retries + 1):
+        try:
+            return await fn()
+        except TransientUpstreamError:
+            if attempt == retries:
+                raise
+            await asyncio.sleep(random.uniform(0, UPSTREAM_RETRY_BASE_DELAY * 2 ** attempt))
+    raise AssertionError("unreachable")
+
+
+async def hedged(fn: Callable[[], Awaitable[T]]) -> T:
+    """Запускает копию запроса, если первый не ответил за p95; возвращает первый успешный ответ"""
+    if not HEDGE_ENABLED:
+        return await fn()
+    tasks = [asyncio.ensure_future(fn())]
+    error: Optional[BaseException] = None
+    try:
+        # Отмена вызывающего на любом этапе отменяет и уже запущенные запросы
+        done, _ = await asyncio.wait(tasks, timeout=hedge_delay())
+        if done:
+            return tasks[0].result()
+        tasks.append(asyncio.ensure_future(fn()))
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                return await next_done
+            except UpstreamError as e:
+                error = e
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class CircuitOpenError(UpstreamError):
+    """Автомат разомкнут: запрос к РСОШ не отправлялся"""
+
+
+class CircuitBreaker:
+    """Автоматический выключатель по доле ошибок и медленных ответов.
+
+    closed — запросы идут, исходы последних BREAKER_WINDOW вызовов копятся в окне;
+    open — запросы отклоняются без обращения к сети до истечения BREAKER_OPEN_SECONDS;
+    half_open — пропускается не больше BREAKER_HALF_OPEN_PROBES пробных запросов:
+    успех замыкает автомат, ошибка снова размыкает.
+    """
+
+    def __init__(
+        self,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        slow_call_rate: float = BREAKER_SLOW_CALL_RATE,
+        slow_call_seconds: float = BREAKER_SLOW_CALL_SECONDS,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+        half_open_probes: int = BREAKER_HALF_OPEN_PROBES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_rate = slow_call_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        # (ошибка, медленный) для последних вызовов
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self.state = "closed"
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.opened = 0
+
+    def retry_after(self) -> float:
+        """Сколько секунд осталось до пробных запросов"""
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - self._clock())
+
+    def is_open(self) -> bool:
+        if self.state == "open" and self.retry_after() <= 0:
+            self.state = "half_open"
+            self._probes = 0
+        return self.state == "open"
+
+    def allow(self) -> bool:
+        if self.is_open():
+            self.rejected += 1
+            return False
+        if self.state == "half_open":
+            if self._probes >= self.half_open_probes:
+                self.rejected += 1
+                return False
+            self._probes += 1
+        return True
+
+    def abandon(self):
+        """Вызов отменён до получения ответа: освобождает место пробного запроса"""
+        if self.state == "half_open" and self._probes > 0:
+            self._probes -= 1
+
+    def record(self, failed: bool, seconds: float):
+        if self.state == "open":
+            # Вызов начался до размыкания: иначе завершающиеся запросы снова размыкали бы
+            # автомат и продлевали окно open
+            return
+        slow = seconds >= self.slow_call_seconds
+        if self.state == "half_open":
+            if failed or slow:
+                self._trip()
+            else:
+                self.state = "closed"
+                self._outcomes.clear()
+            return
+        self._outcomes.append((failed, slow))
+        calls = len(self._outcomes)
+        if calls < self.min_calls:
+            return
+        failures = sum(1 for failed, _ in self._outcomes if failed)
+        slow_calls = sum(1 for _, slow in self._outcomes if slow)
+        if failures / calls >= self.failure_rate or slow_calls / calls >= self.slow_call_rate:
+            self._trip()
+
+    def _trip(self):
+        self.state = "open"
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self.opened += 1
+
+    def stats(self) -> dict:
+        return {
+            "state": "open" if self.is_open() else self.state,
+            "retry_after": round(self.retry_after(), 1),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+UPSTREAM_BREAKER = CircuitBreaker()
+
+
+class LoadShedder:
+    """Ограничение числа одновременно обрабатываемых проверок; лишние отклоняются сразу"""
+
+    def __init__(self, limit: int = MAX_IN_FLIGHT_CHECKS):
+        self.limit = limit
+        self.in_flight = 0
+        self.shed = 0
+
+    def try_acquire(self) -> bool:
+        if self.limit > 0 and self.in_flight >= self.limit:
+            self.shed += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self):
+        self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {"in_flight": self.in_flight, "limit": self.limit, "shed": self.shed}
+
+
+CHECK_SHEDDER = LoadShedder()
@@ -1,103 +1,576 @@
 import json
 import logging
-import re
+import time
+from collections import Counter
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
 import asyncio
 import httpx
-from .models import Person, DiplomaData
-from .utils import sha256_hash, build_url, js_to_json, extract_diploma_codes_with_js2py, smart_decode
-from .olympiads_mai import OLYMPIADS_BVI_MAI
+from .cache import TTLCache
+from .config import (
+    BATCH_CONCURRENCY,
+    CHECK_DEADLINE,
+    RESULT_CACHE_MAX_BYTES,
+    RESULT_CACHE_MAX_ENTRIES,
+    RESULT_CACHE_NEGATIVE_TTL,
+    RESULT_CACHE_TTL,
+    SINGLEFLIGHT_PER_YEAR,
+    YEAR_PLANNER_ENABLED,
+    YEAR_CACHE_CURRENT_TTL,
+    YEAR_CACHE_HISTORICAL_TTL,
+    YEAR_CACHE_MAX_BYTES,
+    YEAR_CACHE_MAX_ENTRIES,
+    YEAR_CACHE_REVALIDATE_YEARS,
+)
+from . import eligibility_lists, metrics, store, tracing
+from .availability import filter_available, mark_available
+from .resilience import (
+    UPSTREAM_BREAKER,
+    UPSTREAM_LATENCY,
+    CircuitOpenError,
+    TransientUpstreamError,
+    UpstreamError,
+    hedged,
+    with_retries,
+)
+from .singleflight import SingleFlight
+from .http_client import http_client, host_slot
+from .eligibility import EligibilityRecord, normalize
+from .eligibility_lists import EligibilityList, active_list, active_lists, on_replaced
+from .models import (
+    AnnotatedCheckResult,
+    AnnotatedDiploma,
+    BatchCheckResult,
+    DiplomaData,
+    EligibilityMatch,
+    award_fields,
+    Person,
+    UniversitiesCheckResult,
+    UniversityVerdict,
+)
+from .utils import sha256_hash, build_url, plan_years, js_to_json, extract_diploma_codes, smart_decode
 
 
 
 logger = logging.getLogger(__name__)
 
-OLYMPIADS_LOOKUP_MAI = None
+# Итоговые списки дипломов по (sha256_hash(person), версия перечня), включая пустые
+RESULT_CACHE: TTLCache[List[DiplomaData]] = TTLCache(RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_MAX_BYTES)
+
+
+class CheckResult(NamedTuple):
+    diplomas: List[DiplomaData]
+    # Годы, которые не удалось получить: ошибка upstream или истёк CHECK_DEADLINE
+    incomplete_years: List[int]
+
+
+class Evaluation(NamedTuple):
+    diploma: DiplomaData
+    # Причина отказа, общая для всех перечней: "form" или "oa_mismatch"; None — решает перечень
+    rejected: Optional[str]
+    # Для каждого перечня (в порядке переданных) — найденная строка перечня или None.
+    # Заполняется и для дипломов, отклонённых по классу, чтобы было видно, что именно не учтено.
+    matches: Tuple[Optional[EligibilityRecord], ...]
+
+
+class YearCacheEntry(NamedTuple):
+    rows: List[DiplomaData]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+# Одновременные проверки одной персоны и запросы одного (year, person_hash) выполняются один раз
+PERSON_FLIGHTS = SingleFlight()
+YEAR_FLIGHTS = SingleFlight()
+
+
+# Все разобранные дипломы по (year, person_hash) вместе с валидаторами HTTP-кэша;
+# перечень вуза применяется позже, поэтому смена перечня не требует повторных запросов
+YEAR_CACHE: TTLCache[YearCacheEntry] = TTLCache(YEAR_CACHE_MAX_ENTRIES, YEAR_CACHE_MAX_BYTES)
 
 
 def init_olympiads_lookup():
-    """Инициализирует lookup-таблицы при запуске приложения"""
-    global OLYMPIADS_LOOKUP_MAI
-    OLYMPIADS_LOOKUP_MAI = {
-        (olympiad["Название олимпиады"], olympiad["Профиль олимпиады"]): True for olympiad in OLYMPIADS_BVI_MAI
-    }
-
-# Регулярное выражение для парсинга информации об олимпиаде
-OA_PATTERN = re.compile(
-    r'№(\d+)\.\s*"([^"]+)"\s*\([^"]*"([^"]+)"[^)]*\),\s*(\d+)\s*уровень\.\s*Диплом\s*(\d+)\s*степени\.'
-)
+    """Загружает перечни олимпиад, если они ещё не загружены (для скриптов вне приложения)"""
+    eligibility_lists.ensure_loaded()
+
+
+def mai_list() -> EligibilityList:
+    """Действующий перечень МАИ, по которому отвечает /check"""
+    eligibility = active_list("mai")
+    if eligibility is None:
+        raise RuntimeError("No eligibility list for mai")
+    return eligibility
+
+
+
+def find_mai_olympiad(olympiad_name: str, speciality: str) -> Optional[EligibilityRecord]:
+    """Ищет олимпиаду в перечне МАИ без учёта регистра, кавычек и пробелов"""
+    return mai_list().find(olympiad_name, speciality)
 
 
 def is_valid_for_mai(olympiad_name: str, speciality: str) -> bool:
     """Проверяет, учитывается ли олимпиада в МАИ"""
-    for olympiad in OLYMPIADS_BVI_MAI:
-        if (olympiad["Название олимпиады"] == olympiad_name and 
-            olympiad["Профиль олимпиады"] == speciality):
-            print("олимпиада в МАИ валидна")
-            return True
-    print("олимпиада в МАИ не валидна")
-    return False
-
-async def fetch_diplomas_for_year(client: httpx.AsyncClient, year: int, person_hash: str) -> List[DiplomaData]:
+    return find_mai_olympiad(olympiad_name, speciality) is not None
+
+def parse_diplomas(content: bytes, year: int, content_type: Optional[str] = None) -> List[DiplomaData]:
+    """Разбирает codes.js во все дипломы с заполненными полями; отбор по перечню — select_eligible"""
+    started = time.perf_counter()
+    js_text = smart_decode(content, content_type)
+    decoded = time.perf_counter()
+    raw_data = extract_diploma_codes(js_text)
+    parsed = time.perf_counter()
+    metrics.DECODE_SECONDS.observe(decoded - started)
+    metrics.JS_PARSE_SECONDS.observe(parsed - decoded)
+    tracing.record("decode", decoded - started, year=year)
+    tracing.record("js_parse", parsed - decoded, year=year)
+    diplomas = []
+    skipped_fields = 0
+    for d in raw_data:
+        if d.get('hashed') is None or d.get('oa') is None or type(d.get('form')) is not int:
+            skipped_fields += 1
+            continue
+        diplomas.append(DiplomaData(
+            hashed=str(d.get('hashed')),
+            oa=str(d.get('oa')),
+            link=f"https://diploma.rsr-olymp.ru/files/rsosh-diplomas-static/compiled-storage-{year}/by-code/{d.get('code')}/white.pdf",
+            form=d['form'],
+            year=year,
+            **award_fields(str(d.get('oa')))
+        ))
+    if skipped_fields:
+        metrics.FILTERED_MISSING_FIELDS.inc(skipped_fields)
+    tracing.record("rows", time.perf_counter() - parsed, year=year)
+    return diplomas
+
+
+def evaluate(rows: List[DiplomaData], lists: List[EligibilityList]) -> List[Evaluation]:
+    """Сверяет дипломы сразу со всеми перечнями по полям, разобранным из oa при загрузке.
+
+    Учитываются только дипломы 10–11 классов — это правило РСОШ, общее для всех вузов.
+    """
+    started = time.perf_counter()
+    no_matches = (None,) * len(lists)
+    evaluations = []
+    for row in rows:
+        if row.olympiad_name is None:
+            evaluations.append(Evaluation(row, "oa_mismatch", no_matches))
+            continue
+        # Без профиля олимпиада не сопоставляется ни с одной строкой перечня
+        key = (normalize(row.olympiad_name), normalize(row.olympiad_profile or ""))
+        matches = tuple(eligibility.index.get(key) for eligibility in lists)
+        if row.form not in (10, 11):
+            evaluations.append(Evaluation(row, "form", matches))
+            continue
+        evaluations.append(Evaluation(row, None, matches))
+    tracing.record("filter", time.perf_counter() - started, lists=len(lists))
+    return evaluations
+
+
+def accepted_by(evaluations: List[Evaluation], position: int) -> List[DiplomaData]:
+    """Дипломы, учитываемые перечнем с номером position в evaluate()"""
+    return [
+        evaluation.diploma
+        for evaluation in evaluations
+        if evaluation.rejected is None and evaluation.matches[position] is not None
+    ]
+
+
+def count_filtered(evaluations: List[Evaluation], lists: int):
+    """Учитывает решения проверки в diploma_filtered_total и diploma_accepted_total.
+
+    Вызывается только на пути /check, чтобы повторный разбор для ?annotated=1 не искажал
+    соотношение причин. Отказы по форме и oa считаются один раз, остальные — по каждому перечню.
+    """
+    skipped = Counter(evaluation.rejected for evaluation in evaluations)
+    if skipped["form"]:
+        metrics.FILTERED_FORM.inc(skipped["form"])
+    if skipped["oa_mismatch"]:
+        metrics.FILTERED_OA_MISMATCH.inc(skipped["oa_mismatch"])
+    checked = len(evaluations) - skipped["form"] - skipped["oa_mismatch"]
+    for position in range(lists):
+        accepted = sum(
+            1 for evaluation in evaluations
+            if evaluation.rejected is None and evaluation.matches[position] is not None
+        )
+        if checked - accepted:
+            metrics.FILTERED_NOT_IN_LIST.inc(checked - accepted)
+        if accepted:
+            metrics.DIPLOMAS_ACCEPTED.inc(accepted)
+
+
+def select_eligible(rows: List[DiplomaData], eligibility: EligibilityList) -> List[DiplomaData]:
+    """Оставляет дипломы 10–11 классов за олимпиады из перечня eligibility"""
+    evaluations = evaluate(rows, [eligibility])
+    count_filtered(evaluations, 1)
+    return accepted_by(evaluations, 0)
+
+
+def is_revalidated_year(year: int) -> bool:
+    """Свежие годы хранилища ещё дополняются, их кэш проверяется условным запросом"""
+    return year > datetime.now().year - YEAR_CACHE_REVALIDATE_YEARS
+
+
+def remember_year(key: tuple, entry: YearCacheEntry, ttl: float):
+    """Кладёт ответ за год в кэш в памяти и ставит в очередь записи в SQLite"""
+    YEAR_CACHE.set(key, entry, ttl)
+    if store.STORE is not None:
+        year, person_hash = key
+        store.STORE.put(year, person_hash, entry.rows, entry.etag, entry.last_modified)
+
+
+async def request_year(client: httpx.AsyncClient, year: int, url: str, headers: Dict[str, str]) -> httpx.Response:
+    """Один запрос к хранилищу через автоматический выключатель; сеть, 429 и 5xx — временные ошибки"""
+    async with host_slot(url):
+        if not UPSTREAM_BREAKER.allow():
+            metrics.UPSTREAM_FETCH_SECONDS.labels(str(year), "circuit_open").observe(0)
+            raise CircuitOpenError(f"Circuit open, retry in {UPSTREAM_BREAKER.retry_after():.0f}s")
+        started = time.perf_counter()
+        metrics.UPSTREAM_IN_FLIGHT.inc()
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.RequestError as exc:
+            elapsed = time.perf_counter() - started
+            UPSTREAM_BREAKER.record(True, elapsed)
+            metrics.UPSTREAM_FETCH_SECONDS.labels(str(year), "error").observe(elapsed)
+            tracing.record("upstream", elapsed, year=year, status="error")
+            raise TransientUpstreamError(f"{type(exc).__name__}: {exc}") from exc
+        except asyncio.CancelledError:
+            UPSTREAM_BREAKER.abandon()
+            raise
+        finally:
+            metrics.UPSTREAM_IN_FLIGHT.dec()
+    elapsed = time.perf_counter() - started
+    metrics.UPSTREAM_FETCH_SECONDS.labels(str(year), str(response.status_code)).observe(elapsed)
+    tracing.record("upstream", elapsed, year=year, status=response.status_code)
+    failed = response.status_code == 429 or response.status_code >= 500
+    UPSTREAM_BREAKER.record(failed, elapsed)
+    if failed:
+        raise TransientUpstreamError(f"Error {response.status_code} for {url}")
+    UPSTREAM_LATENCY.observe(elapsed)
+    return response
+
+
+async def fetch_diplomas_for_year(
+    client: httpx.AsyncClient, year: int, person_hash: str, revalidate: bool = True
+) -> List[DiplomaData]:
+    """Дипломы персоны за год; при недоступности года бросает UpstreamError.
+
+    revalidate=False отдаёт свежую запись кэша без условного запроса даже для текущих лет.
+    """
+    if not SINGLEFLIGHT_PER_YEAR:
+        return await _fetch_diplomas_for_year(client, year, person_hash, revalidate)
+    return await YEAR_FLIGHTS.do(
+        (year, person_hash, revalidate), lambda: _fetch_diplomas_for_year(client, year, person_hash, revalidate)
+    )
+
+
+async def _fetch_diplomas_for_year(
+    client: httpx.AsyncClient, year: int, person_hash: str, revalidate: bool = True
+) -> List[DiplomaData]:
+    key = (year, person_hash)
+    started = time.perf_counter()
+    cached = YEAR_CACHE.get(key)
+    current = is_revalidated_year(year)
+    revalidate = revalidate and current
+    ttl = YEAR_CACHE_CURRENT_TTL if current else YEAR_CACHE_HISTORICAL_TTL
+    tracing.record("year_cache", time.perf_counter() - started, year=year, hit=cached is not None)
+    if cached is None and store.STORE is not None:
+        started = time.perf_counter()
+        try:
+            stored = await store.STORE.get(year, person_hash)
+        except Exception as e:
+            logger.error(f"Failed to read diploma store for year {year}: {e}")
+            stored = None
+        tracing.record("store", time.perf_counter() - started, year=year, hit=stored is not None)
+        if stored is not None:
+            cached = YearCacheEntry(stored.rows, stored.etag, stored.last_modified)
+            YEAR_CACHE.set(key, cached, ttl)
+    if cached is not None and not revalidate:
+        return cached.rows
+
     url = build_url(year, person_hash)
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
     try:
-        response = await client.get(url, timeout=5)
-    except httpx.RequestError as exc:
+        response = await with_retries(lambda: hedged(lambda: request_year(client, year, url, headers)))
+    except UpstreamError as exc:
+        if cached is not None:
+            logger.warning(f"Serving cached result for {year} after upstream error: {exc}")
+            return cached.rows
         logger.error(f"Request failed for {year}: {exc}")
-        return []
+        raise
+
+    if response.status_code == 304 and cached is not None:
+        remember_year(key, cached, ttl)
+        return cached.rows
 
     if response.status_code == 404:
+        remember_year(key, YearCacheEntry([], None, None), ttl)
         return []
 
     if response.status_code != 200:
         logger.error(f"Error {response.status_code} for {url}")
-        return []
+        raise UpstreamError(f"Error {response.status_code} for {url}")
 
+    mark_available(year)
     try:
-        js_text = smart_decode(response.content)
-        raw_data = extract_diploma_codes_with_js2py(js_text)
-        diplomas = []
-        for d in raw_data:
-            if d.get('form') not in (10, 11):
-                continue
-            if d.get('hashed') is None or d.get('oa') is None or d.get('form') is None:
-                continue
-            oa_str = d.get('oa', '')
-            match = OA_PATTERN.match(oa_str)
-            if not match:
-                logger.warning(f"Failed to parse oa string: {oa_str}")
-                continue
-            olympiad_name = match.group(2)
-            olympiad_speciality = match.group(3)
-            if not is_valid_for_mai(olympiad_name, olympiad_speciality):
-                continue
-            diplomas.append(DiplomaData(
-                hashed=str(d.get('hashed')),
-                oa=str(d.get('oa')),
-                link=f"https://diploma.rsr-olymp.ru/files/rsosh-diplomas-static/compiled-storage-{year}/by-code/{d.get('code')}/white.pdf",
-                form=d['form'],
-                year=year
-            ))
-        return diplomas
+        diplomas = parse_diplomas(response.content, year, response.headers.get("content-type"))
     except Exception as e:
         logger.error(f"Failed to parse response for year {year}: {e}")
-        return []
+        raise UpstreamError(f"Failed to parse response for year {year}: {e}") from e
+    remember_year(key, YearCacheEntry(
+        diplomas, response.headers.get("etag"), response.headers.get("last-modified")
+    ), ttl)
+    return diplomas
 
 
-async def get_all_diplomas(person: Person, years_back: int = 7) -> List[DiplomaData]:
+async def get_all_diplomas(person: Person, years_back: int = 7, revalidate: bool = True) -> CheckResult:
     person_hash = sha256_hash(person)
     current_year = datetime.now().year
 
-    async with httpx.AsyncClient() as client:
-        results = await asyncio.gather(*[
-            fetch_diplomas_for_year(client, year, person_hash)
-            for year in range(current_year, current_year - years_back, -1)
-        ])
+    if YEAR_PLANNER_ENABLED:
+        years = plan_years(person.birthdate, current_year, years_back)
+    else:
+        years = list(range(current_year, current_year - years_back, -1))
+    # Подтверждённо неопубликованный год дипломов не содержит — как ответ 404 от РСОШ
+    years = filter_available(years)
+    logger.debug(f"Planned storage years for {person_hash[:12]}: {years}")
+    tracing.note("planned_years", years)
+    if not years:
+        return CheckResult([], [])
+
+    async with http_client() as client:
+        tasks = {
+            asyncio.ensure_future(fetch_diplomas_for_year(client, year, person_hash, revalidate)): year
+            for year in years
+        }
+        _, pending = await asyncio.wait(tasks, timeout=CHECK_DEADLINE if CHECK_DEADLINE > 0 else None)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    diplomas: List[DiplomaData] = []
+    incomplete_years: List[int] = []
+    for task, year in tasks.items():
+        if task in pending:
+            logger.warning(f"Check deadline exceeded for year {year}")
+            incomplete_years.append(year)
+        elif task.exception() is not None:
+            if not isinstance(task.exception(), UpstreamError):
+                logger.error(f"Unexpected error for year {year}: {task.exception()!r}")
+            incomplete_years.append(year)
+        else:
+            diplomas.extend(task.result())
+    return CheckResult(diplomas, incomplete_years)
+
+
+async def check_lists(person: Person, lists: List[EligibilityList]) -> Tuple[List[List[DiplomaData]], List[int]]:
+    """Учитываемые дипломы персоны по каждому перечню и годы, которые не удалось получить.
+
+    Результаты кэшируются по (персона, версия перечня). Если для каких-то перечней
+    их нет, дипломы персоны загружаются один раз и сверяются со всеми этими перечнями
+    за один проход. Возвращаемые DiplomaData общие с кэшем и не должны изменяться.
+    """
+    person_hash = sha256_hash(person)
+    results: List[Optional[List[DiplomaData]]] = [RESULT_CACHE.get((person_hash, e.version)) for e in lists]
+    missing = [position for position, rows in enumerate(results) if rows is None]
+    tracing.note("result_cache_hit", not missing)
+    if not missing:
+        return results, []
+    diplomas, incomplete_years = await PERSON_FLIGHTS.do(person_hash, lambda: get_all_diplomas(person))
+    evaluations = evaluate(diplomas, [lists[position] for position in missing])
+    count_filtered(evaluations, len(missing))
+    for column, position in enumerate(missing):
+        rows = accepted_by(evaluations, column)
+        results[position] = rows
+        if not incomplete_years:
+            ttl = RESULT_CACHE_TTL if rows else RESULT_CACHE_NEGATIVE_TTL
+            RESULT_CACHE.set((person_hash, lists[position].version), rows, ttl)
+    return results, incomplete_years
+
+
+async def get_diplomas_data(person: Person) -> CheckResult:
+    """Дипломы персоны, учитываемые МАИ; возвращаемые DiplomaData общие с кэшем и не должны изменяться"""
+    results, incomplete_years = await check_lists(person, [mai_list()])
+    return CheckResult(list(results[0]), incomplete_years)
+
+
+async def check_universities(person: Person, universities: Optional[List[str]] = None) -> UniversitiesCheckResult:
+    """Решения по действующим перечням нескольких вузов из одной загрузки дипломов персоны"""
+    lists = active_lists(universities)
+    results, incomplete_years = await check_lists(person, lists)
+    return UniversitiesCheckResult(
+        verdicts=[
+            UniversityVerdict(
+                university=eligibility.university,
+                academic_year=eligibility.academic_year,
+                list_version=eligibility.version,
+                eligible=bool(rows),
+                diplomas=rows,
+            )
+            for eligibility, rows in zip(lists, results)
+        ],
+        incomplete_years=incomplete_years,
+    )
+
+
+def annotate(evaluation: Evaluation, position: int) -> AnnotatedDiploma:
+    """Диплом с решением по перечню с номером position в evaluate() и найденной строкой перечня"""
+    record = evaluation.matches[position]
+    reason = evaluation.rejected or (None if record is not None else "not_in_list")
+    return AnnotatedDiploma(
+        **evaluation.diploma.model_dump(),
+        accepted=reason is None,
+        reason=reason,
+        olympiad=None if record is None else EligibilityMatch(
+            name=record.name,
+            profile=record.profile,
+            subject=record.subject,
+            level=record.level,
+            list_number=record.list_number,
+            programmes=list(record.programmes),
+            programmes_excluded=record.programmes_excluded,
+        ),
+    )
+
+
+async def get_annotated_diplomas(person: Person) -> AnnotatedCheckResult:
+    """Все разобранные дипломы персоны с решением по перечню МАИ.
+
+    Свежие записи кэша по годам используются без условных запросов, поэтому после /check
+    для той же персоны ответ не требует обращений к РСОШ; запрашиваются только годы,
+    которых нет в кэше.
+    """
+    eligibility = mai_list()
+    person_hash = sha256_hash(person)
+    diplomas, incomplete_years = await PERSON_FLIGHTS.do(
+        (person_hash, "cached"), lambda: get_all_diplomas(person, revalidate=False)
+    )
+    evaluations = evaluate(diplomas, [eligibility])
+    return AnnotatedCheckResult(
+        university=eligibility.university,
+        academic_year=eligibility.academic_year,
+        list_version=eligibility.version,
+        diplomas=[annotate(evaluation, 0) for evaluation in evaluations],
+        incomplete_years=incomplete_years,
+    )
+
+
+def drop_list_results(replaced: EligibilityList) -> int:
+    """Удаляет результаты, посчитанные по заменённой версии перечня; ответы по годам остаются"""
+    if any(current.version == replaced.version for current in eligibility_lists.LISTS.values()):
+        return 0
+    dropped = 0
+    for key in RESULT_CACHE.keys():
+        if key[1] == replaced.version:
+            dropped += RESULT_CACHE.invalidate(key)
+    logger.info(f"Dropped {dropped} cached results for eligibility list version {replaced.version}")
+    return dropped
+
+
+on_replaced(drop_list_results)
+
+
+_BATCH_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+
+async def check_person(person: Person, index: int = 0) -> BatchCheckResult:
+    """Проверяет одну персону пакета; число одновременных проверок ограничено BATCH_CONCURRENCY"""
+    global _BATCH_SEMAPHORE
+    if _BATCH_SEMAPHORE is None:
+        _BATCH_SEMAPHORE = asyncio.Semaphore(BATCH_CONCURRENCY)
+    async with _BATCH_SEMAPHORE:
+        try:
+            diplomas, incomplete_years = await get_diplomas_data(person)
+        except Exception as e:
+            logger.exception(f"Batch check failed for item {index}: {e}")
+            return BatchCheckResult(index=index, status="error", error=str(e))
+    if diplomas:
+        status, error = "found", None
+    elif incomplete_years:
+        status, error = "error", f"Upstream unavailable for years {', '.join(map(str, incomplete_years))}"
+    else:
+        status, error = "none", None
+    return BatchCheckResult(
+        index=index, status=status, diplomas=diplomas, incomplete_years=incomplete_years, error=error
+    )
+
+
+def group_by_person(persons: List[Person]) -> Dict[str, List[int]]:
+    """Группирует позиции входного списка по хэшу персоны, чтобы проверять дубликаты один раз"""
+    groups: Dict[str, List[int]] = {}
+    for index, person in enumerate(persons):
+        groups.setdefault(sha256_hash(person), []).append(index)
+    return groups
+
+
+async def iter_batch(persons: List[Person]) -> AsyncIterator[BatchCheckResult]:
+    """Отдаёт результаты пакетной проверки по мере готовности, в произвольном порядке.
+
+    Уникальные персоны разбирают BATCH_CONCURRENCY воркеров; очередь результатов
+    ограничена, поэтому медленный потребитель притормаживает проверку, а не копит ответы.
+    """
+    groups = iter(group_by_person(persons).values())
+    results: asyncio.Queue = asyncio.Queue(maxsize=BATCH_CONCURRENCY)
+
+    async def worker():
+        for indices in groups:
+            outcome = await check_person(persons[indices[0]], indices[0])
+            for index in indices:
+                await results.put(outcome.model_copy(update={"index": index}))
+        await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(BATCH_CONCURRENCY)]
+    running = len(workers)
+    try:
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+                continue
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+async def check_batch(persons: List[Person]) -> List[BatchCheckResult]:
+    results: List[Optional[BatchCheckResult]] = [None] * len(persons)
+    async for result in iter_batch(persons):
+        results[result.index] = result
+    return results
+
+
+def invalidate_cached_result(person: Person) -> bool:
+    """Удаляет закэшированный результат проверки персоны и её ответы по годам"""
+    person_hash = sha256_hash(person)
+    invalidated = False
+    for key in RESULT_CACHE.keys():
+        if key[0] == person_hash:
+            invalidated = RESULT_CACHE.invalidate(key) or invalidated
+    for key in YEAR_CACHE.keys():
+        if key[1] == person_hash:
+            invalidated = YEAR_CACHE.invalidate(key) or invalidated
+    if store.STORE is not None:
+        store.STORE.delete(person_hash)
+    return invalidated
+
+
+def flush_cached_results() -> int:
+    """Очищает кэши и хранилище ответов по годам, возвращает число удалённых записей в памяти"""
+    if store.STORE is not None:
+        store.STORE.clear()
+    return RESULT_CACHE.clear() + YEAR_CACHE.clear()
+
 
-    return [item for sublist in results for item in sublist]
+def cache_stats() -> dict:
+    return {"results": RESULT_CACHE.stats(), "years": YEAR_CACHE.stats()}
 
 
-async def get_diplomas_data(person: Person) -> List[DiplomaData]:
-    rows = await get_all_diplomas(person)
-    return [DiplomaData(hashed=row.hashed, oa=row.oa, link=row.link, form=row.form, year=row.year) for row in rows]
+def coalescing_stats() -> dict:
+    return {"persons": PERSON_FLIGHTS.stats(), "years": YEAR_FLIGHTS.stats()}
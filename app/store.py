@@ -0,0 +1,220 @@
+"""Постоянное хранилище ответов РСОШ по годам в SQLite.
+
+Хранит все разобранные дипломы (до отбора по перечню вуза) и 404 по (person_hash, year), чтобы после перезапуска
+контейнера не запрашивать всё заново. Чтение выполняется в отдельном потоке,
+запись — фоновой задачей пачками, вне пути обработки запроса.
+
+Очистка устаревших записей и сжатие файла базы::
+
+    python -m app.store compact
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+
+from .config import DIPLOMA_STORE_NEGATIVE_RETENTION_DAYS, DIPLOMA_STORE_PATH, DIPLOMA_STORE_RETENTION_DAYS
+from .models import DIPLOMA_LIST, DiplomaData, award_fields
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS year_results (
+    person_hash TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    rows TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (person_hash, year)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS year_results_fetched_at ON year_results (fetched_at);
+"""
+
+# Версия 1: строки хранятся до отбора по перечню; в файлах версии 0 они отфильтрованы по МАИ
+_SCHEMA_VERSION = 1
+_WRITE_BATCH = 500
+
+
+class StoredYear(NamedTuple):
+    rows: List[DiplomaData]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class DiplomaStore:
+    def __init__(
+        self,
+        path: str,
+        retention_days: float = DIPLOMA_STORE_RETENTION_DAYS,
+        negative_retention_days: float = DIPLOMA_STORE_NEGATIVE_RETENTION_DAYS,
+    ):
+        self.path = path
+        self.retention = retention_days * 86400
+        self.negative_retention = negative_retention_days * 86400
+        # Один поток: sqlite3-соединение используется строго последовательно
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diploma-store")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+
+    def open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS year_results")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+
+    def close(self):
+        self._close_connection()
+        self._executor.shutdown(wait=True)
+
+    def _close_connection(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.open)
+        removed = await loop.run_in_executor(self._executor, self.purge_expired)
+        if removed:
+            logger.info(f"Removed {removed} expired rows from diploma store")
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self):
+        if self._writer is not None:
+            await self._queue.join()
+            self._writer.cancel()
+            self._writer = None
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._close_connection)
+        self._executor.shutdown(wait=True)
+
+    async def get(self, year: int, person_hash: str) -> Optional[StoredYear]:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._read, year, person_hash)
+
+    def put(self, year: int, person_hash: str, rows: List[DiplomaData], etag: Optional[str], last_modified: Optional[str]):
+        """Ставит запись в очередь фоновой записи и сразу возвращает управление"""
+        payload = DIPLOMA_LIST.dump_json(rows).decode()
+        self._enqueue(
+            "INSERT OR REPLACE INTO year_results (person_hash, year, rows, etag, last_modified, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (person_hash, year, payload, etag, last_modified, time.time()),
+        )
+
+    def delete(self, person_hash: str):
+        self._enqueue("DELETE FROM year_results WHERE person_hash = ?", (person_hash,))
+
+    def clear(self):
+        self._enqueue("DELETE FROM year_results", ())
+
+    def _enqueue(self, sql: str, params: Tuple):
+        if self._queue is not None:
+            self._queue.put_nowait((sql, params))
+
+    def _read(self, year: int, person_hash: str) -> Optional[StoredYear]:
+        row = self._conn.execute(
+            "SELECT rows, etag, last_modified, fetched_at FROM year_results WHERE person_hash = ? AND year = ?",
+            (person_hash, year),
+        ).fetchone()
+        if row is None:
+            return None
+        rows = DIPLOMA_LIST.validate_json(row[0])
+        # Записи, сохранённые до появления разобранных полей oa
+        rows = [
+            item if item.olympiad_name is not None else item.model_copy(update=award_fields(item.oa))
+            for item in rows
+        ]
+        retention = self.retention if rows else self.negative_retention
+        if row[3] + retention <= time.time():
+            return None
+        return StoredYear(rows, row[1], row[2], row[3])
+
+    def _write(self, batch: List[Tuple[str, Tuple]]):
+        with self._conn:
+            self._conn.execute("BEGIN")
+            for sql, params in batch:
+                self._conn.execute(sql, params)
+
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < _WRITE_BATCH and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await loop.run_in_executor(self._executor, self._write, batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} rows to diploma store: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def purge_expired(self) -> int:
+        """Удаляет записи старше срока хранения (для пустых результатов — свой срок)"""
+        now = time.time()
+        with self._conn:
+            self._conn.execute("BEGIN")
+            cursor = self._conn.execute(
+                "DELETE FROM year_results WHERE (rows = '[]' AND fetched_at < ?) OR fetched_at < ?",
+                (now - self.negative_retention, now - self.retention),
+            )
+        return cursor.rowcount
+
+    def compact(self) -> int:
+        removed = self.purge_expired()
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._conn.execute("VACUUM")
+        return removed
+
+
+STORE: Optional[DiplomaStore] = None
+
+
+async def init_store():
+    """Открывает хранилище при запуске приложения, если задан DIPLOMA_STORE_PATH"""
+    global STORE
+    if DIPLOMA_STORE_PATH and STORE is None:
+        store = DiplomaStore(DIPLOMA_STORE_PATH)
+        await store.start()
+        STORE = store
+
+
+async def close_store():
+    global STORE
+    if STORE is not None:
+        await STORE.stop()
+        STORE = None
+
+
+def main(argv: List[str]) -> int:
+    if argv != ["compact"]:
+        print("usage: python -m app.store compact", file=sys.stderr)
+        return 2
+    if not DIPLOMA_STORE_PATH:
+        print("DIPLOMA_STORE_PATH is not set", file=sys.stderr)
+        return 1
+    store = DiplomaStore(DIPLOMA_STORE_PATH)
+    store.open()
+    try:
+        removed = store.compact()
+    finally:
+        store.close()
+    print(f"Removed {removed} expired rows, database compacted")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
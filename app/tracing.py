@@ -0,0 +1,59 @@
+"""Поэтапные замеры времени одной проверки для Server-Timing и ?debug=1.
+
+Трасса хранится в contextvar и создаётся только обработчиком запроса при
+включённом TIMING_ENABLED; без неё record() и note() сразу возвращаются.
+Задачи asyncio наследуют контекст, поэтому замеры из параллельных запросов
+по годам попадают в трассу запроса, который их запустил.
+"""
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+
+class Trace:
+    __slots__ = ("started", "spans", "notes")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self.notes: Dict[str, Any] = {}
+
+    def record(self, stage: str, seconds: float, **attrs):
+        self.spans.append({"stage": stage, "ms": round(seconds * 1000, 3), **attrs})
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 3)
+
+    def server_timing(self) -> str:
+        """Значение заголовка Server-Timing: сумма по этапу и году плюс общее время"""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            name = span["stage"] if "year" not in span else f"{span['stage']}_{span['year']}"
+            totals[name] = totals.get(name, 0.0) + span["ms"]
+        parts = [f"{name};dur={ms:.3f}" for name, ms in totals.items()]
+        parts.append(f"total;dur={self.elapsed_ms():.3f}")
+        return ", ".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"total_ms": self.elapsed_ms(), **self.notes, "spans": self.spans}
+
+
+_TRACE: ContextVar[Optional[Trace]] = ContextVar("diploma_trace", default=None)
+
+
+def start() -> Trace:
+    trace = Trace()
+    _TRACE.set(trace)
+    return trace
+
+
+def record(stage: str, seconds: float, **attrs):
+    trace = _TRACE.get()
+    if trace is not None:
+        trace.record(stage, seconds, **attrs)
+
+
+def note(key: str, value: Any):
+    trace = _TRACE.get()
+    if trace is not None:
+        trace.notes[key] = value
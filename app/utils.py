@@ -1,7 +1,10 @@
 import hashlib
 import logging
+from datetime import date
+from typing import List, Optional
 from .models import Person
-import js2py
+from .config import JS2PY_FALLBACK, RSOSH_BASE_URL, YEAR_PLANNER_SLACK
+from .js_parser import JSParseError, parse_diploma_codes
 logger = logging.getLogger(__name__)
 
 def sha256_hash(person: Person) -> str:
@@ -9,8 +12,24 @@ def sha256_hash(person: Person) -> str:
     return hashlib.sha256(namestring.encode()).hexdigest()
 
 
+def build_storage_url(year: int) -> str:
+    return f"{RSOSH_BASE_URL}/files/rsosh-diplomas-static/compiled-storage-{year}/"
+
+
 def build_url(year: int, hashed_person: str) -> str:
-    return f"https://diploma.rsr-olymp.ru/files/rsosh-diplomas-static/compiled-storage-{year}/by-person-released/{hashed_person}/codes.js"
+    return f"{build_storage_url(year)}by-person-released/{hashed_person}/codes.js"
+
+def plan_years(birthdate: date, current_year: int, years_back: int, slack: int = YEAR_PLANNER_SLACK) -> List[int]:
+    """Годы хранилища, в которые персона могла учиться в 10–11 классе, от новых к старым.
+
+    Родившиеся до сентября обычно оканчивают 11 класс весной года birthdate.year + 18,
+    остальные — на год позже; slack добавляет запас на ранний/поздний приход в школу
+    и повторное обучение. Годы ограничены окном из years_back лет до current_year.
+    """
+    graduation = birthdate.year + (18 if birthdate.month < 9 else 19)
+    newest = min(current_year, graduation + slack)
+    oldest = max(current_year - years_back + 1, graduation - 1 - slack)
+    return list(range(newest, oldest - 1, -1))
 
 import re
 
@@ -27,7 +46,18 @@ def js_to_json(js_text: str) -> str:
 
     return array_text
 
+def extract_diploma_codes(js_text: str) -> list[dict]:
+    """Извлекает массив diplomaCodes; js2py используется только как откат по JS2PY_FALLBACK"""
+    try:
+        return parse_diploma_codes(js_text)
+    except JSParseError as e:
+        if not JS2PY_FALLBACK:
+            raise
+        logger.warning(f"Fast codes.js parser rejected input, falling back to js2py: {e}")
+    return extract_diploma_codes_with_js2py(js_text)
+
 def extract_diploma_codes_with_js2py(js_text: str) -> list[dict]:
+    import js2py
     try:
         context = js2py.EvalJs()
         context.execute(js_text)
@@ -37,9 +67,40 @@ def extract_diploma_codes_with_js2py(js_text: str) -> list[dict]:
         logger.exception(f"Failed to extract with js2py: {e}")
         raise
 
-import chardet
+try:
+    import cchardet as chardet  # C-реализация, если установлена
+except ImportError:
+    import chardet
+
+# Сколько ответов декодировано каждым способом
+DECODE_STATS = {"utf8": 0, "charset": 0, "detected": 0}
 
-def smart_decode(content: bytes) -> str:
+def _header_charset(content_type: Optional[str]) -> Optional[str]:
+    if not content_type:
+        return None
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset" and value.strip():
+            return value.strip().strip('"').lower()
+    return None
+
+def smart_decode(content: bytes, content_type: Optional[str] = None) -> str:
+    """Декодирует ответ: строгий UTF-8, затем charset из Content-Type, затем определение кодировки"""
+    try:
+        text = content.decode("utf-8")
+        DECODE_STATS["utf8"] += 1
+        return text[1:] if text.startswith("\ufeff") else text
+    except UnicodeDecodeError:
+        pass
+    charset = _header_charset(content_type)
+    if charset and charset not in ("utf-8", "utf8"):
+        try:
+            text = content.decode(charset)
+            DECODE_STATS["charset"] += 1
+            return text
+        except (LookupError, UnicodeDecodeError):
+            pass
+    DECODE_STATS["detected"] += 1
     result = chardet.detect(content)
     encoding = result["encoding"] or "utf-8"
     return content.decode(encoding, errors="replace")
@@ -0,0 +1,64 @@
+"""Стоимость ответа /check: прежний путь через response_model против заранее сериализованного JSON.
+
+Прежний путь: get_diplomas_data пересобирает каждый DiplomaData, затем FastAPI
+валидирует список по response_model и рендерит JSONResponse. Новый: список из
+кэша отдаётся как есть и сериализуется dump_diplomas (orjson или pydantic).
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.check_response
+"""
+import asyncio
+import time
+import timeit
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from app import main as app_main
+from app.models import DiplomaData
+from app.service import init_olympiads_lookup, mai_list, parse_diplomas, select_eligible
+from benchmarks.fixtures import make_codes_js
+
+
+def make_rows(count: int) -> list[DiplomaData]:
+    rows = []
+    seed = 0
+    while len(rows) < count:
+        content = make_codes_js(100, seed).encode()
+        rows.extend(select_eligible(parse_diplomas(content, 2024, "application/javascript"), mai_list()))
+        seed += 1
+    return rows[:count]
+
+
+async def old_path(rows: list[DiplomaData], field, number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        rebuilt = [DiplomaData(hashed=r.hashed, oa=r.oa, link=r.link, form=r.form, year=r.year) for r in rows]
+        content = await serialize_response(field=field, response_content=rebuilt)
+        JSONResponse(content).body
+    return (time.perf_counter() - started) / number
+
+
+def new_path(rows: list[DiplomaData]):
+    app_main.dump_diplomas(list(rows))
+
+
+def main():
+    init_olympiads_lookup()
+    field = next(route for route in app_main.app.routes if getattr(route, "path", None) == "/check").response_field
+    serializer = "orjson" if app_main.orjson is not None else "pydantic"
+    print(f"serializer: {serializer}")
+    print(f"{'diplomas':>8} {'old, us':>10} {'new, us':>10} {'speedup':>8}")
+    for count in (1, 10, 100):
+        rows = make_rows(count)
+        expected = JSONResponse(asyncio.run(serialize_response(field=field, response_content=rows))).body
+        assert app_main.dump_diplomas(rows) == expected
+        number = 2000 if count < 100 else 200
+        old = min(asyncio.run(old_path(rows, field, number)) for _ in range(5))
+        new = min(timeit.repeat(lambda: new_path(rows), number=number, repeat=5)) / number
+        print(f"{count:>8} {old * 1e6:>10.1f} {new * 1e6:>10.1f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
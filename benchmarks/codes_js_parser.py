@@ -0,0 +1,73 @@
+"""Сверка быстрого парсера codes.js с js2py и замер стоимости разбора.
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.codes_js_parser
+"""
+import sys
+import timeit
+
+from app.js_parser import JSParseError, parse_diploma_codes
+from app.utils import extract_diploma_codes_with_js2py
+from benchmarks.fixtures import make_codes_js
+
+# Варианты записи, которые должен понимать парсер, помимо чистого JSON
+CORPUS = [
+    "var diplomaCodes = [];",
+    "diplomaCodes = [{}]",
+    "let diplomaCodes=[{code:1,form:11,oa:'x',hashed:\"y\"}];",
+    "const diplomaCodes = [{'code': 12, \"form\": 10,},];\n",
+    "// header\nvar diplomaCodes = /* inline */ [{code: 1 /* c */, form: 11}];\n// tail\n",
+    "var diplomaCodes = [{a: 1.0, b: 1e3, c: -0, d: 0x1f, e: undefined, f: null, g: true, h: false}];",
+    "var diplomaCodes = [{1: 'one', 2.5: 'two', i: [1, 2, ], j: {}, k: .5, l: -2.25, m: 1e21}];",
+    "var diplomaCodes = [{s: '\\u0041\\x42\\n\\t\\'\\\"\\\\', t: \"line\\\ncontinued\"}];",
+    "var diplomaCodes = [{s: 'кириллица «ёлочки»', t: \"\\u00ab\\u00bb\"}];",
+    "var diplomaCodes = [{code: 12345678901234567890, big: 9007199254740993}];",
+    "var diplomaCodes = [{\"code\": 12345678901234567890, \"n\": 1.0, \"e\": 2E2}];",
+    "var diplomaCodes = [{code: 1}]\n",
+]
+CORPUS += [make_codes_js(size, seed) for size in (1, 10, 100) for seed in range(3)]
+
+# Входы, которые быстрый парсер обязан отвергнуть (их разберёт только js2py)
+REJECTED = [
+    "var diplomaCodes = [1, 2]; var other = 3;",
+    "var diplomaCodes = [].concat([{code: 1}]);",
+    "var diplomaCodes = {code: 1};",
+    "var diplomaCodes = [NaN];",
+    "var diplomaCodes = [1,,2];",
+    "var other = [];",
+]
+
+
+def check_corpus() -> int:
+    failures = 0
+    for sample in CORPUS:
+        expected = extract_diploma_codes_with_js2py(sample)
+        actual = parse_diploma_codes(sample)
+        if actual != expected:
+            failures += 1
+            print(f"MISMATCH {sample[:80]!r}\n  js2py: {expected!r}\n  fast:  {actual!r}")
+    for sample in REJECTED:
+        try:
+            parse_diploma_codes(sample)
+        except JSParseError:
+            continue
+        failures += 1
+        print(f"NOT REJECTED {sample!r}")
+    print(f"corpus: {len(CORPUS)} equal-output samples, {len(REJECTED)} rejected samples, {failures} failures")
+    return failures
+
+
+def bench(number: int = 20):
+    print(f"{'diplomas':>8} {'fast, us':>12} {'js2py, us':>12} {'speedup':>8}")
+    for size in (1, 10, 100):
+        text = make_codes_js(size)
+        fast = min(timeit.repeat(lambda: parse_diploma_codes(text), number=number, repeat=5)) / number
+        slow = min(timeit.repeat(lambda: extract_diploma_codes_with_js2py(text), number=1, repeat=3))
+        print(f"{size:>8} {fast * 1e6:>12.1f} {slow * 1e6:>12.1f} {slow / fast:>7.0f}x")
+
+
+if __name__ == "__main__":
+    failed = check_corpus()
+    bench()
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,37 @@
+"""Синтетические codes.js, похожие на файлы статического хранилища РСОШ"""
+import hashlib
+import json
+import os
+import random
+
+from app.config import ELIGIBILITY_DIR
+from app.eligibility import EligibilityRecord, load_records
+
+OLYMPIADS = load_records(os.path.join(ELIGIBILITY_DIR, "mai", "2024-25.json"))
+
+
+def make_oa(olympiad: EligibilityRecord, number: int, level: int, degree: int) -> str:
+    return (
+        f'№{number}. "{olympiad.name}" '
+        f'(профиль "{olympiad.profile}"), '
+        f'{level} уровень. Диплом {degree} степени.'
+    )
+
+
+def make_diplomas(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    diplomas = []
+    for i in range(count):
+        olympiad = rng.choice(OLYMPIADS)
+        diplomas.append({
+            "code": rng.randrange(10 ** 9, 10 ** 10),
+            "form": rng.choice((9, 10, 11)),
+            "hashed": hashlib.sha256(f"{seed}-{i}".encode()).hexdigest(),
+            "oa": make_oa(olympiad, olympiad.list_number, olympiad.level, rng.randint(1, 3)),
+        })
+    return diplomas
+
+
+def make_codes_js(count: int, seed: int = 0) -> str:
+    payload = json.dumps(make_diplomas(count, seed), ensure_ascii=False)
+    return f"var diplomaCodes = {payload};\n"
@@ -0,0 +1,188 @@
+"""Нагрузочный прогон /check и /check/batch против локальной заглушки РСОШ.
+
+Запускает benchmarks.stub_server и приложение в отдельных процессах uvicorn,
+гоняет запросы с фиксированной конкурентностью и печатает RPS, p50/p95/p99 и
+процессорное время приложения на запрос. Результат сохраняется в JSON; с
+--baseline печатается сравнение с предыдущим прогоном.
+
+    python -m benchmarks.load --requests 2000 --concurrency 50
+    python -m benchmarks.load --endpoint batch --batch-size 100 --requests 20
+    python -m benchmarks.load --output benchmarks/results/new.json --baseline benchmarks/results/base.json
+
+Параметры заглушки (STUB_*) берутся из окружения, см. benchmarks/stub_server.py.
+По умолчанию кэши приложения отключены, чтобы мерить полный путь запроса;
+--cache оставляет их включёнными.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NO_CACHE_ENV = {
+    "RESULT_CACHE_MAX_ENTRIES": "0",
+    "YEAR_CACHE_MAX_ENTRIES": "0",
+    "DIPLOMA_STORE_PATH": "",
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(module: str, port: int, env: Dict[str, str], verbose: bool = False) -> subprocess.Popen:
+    output = None if verbose else subprocess.DEVNULL
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", module, "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        env={**os.environ, **env},
+        stdout=output,
+        stderr=output,
+    )
+
+
+async def wait_ready(url: str, timeout: float = 20):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"{url} did not start")
+
+
+def cpu_seconds(pid: int) -> Optional[float]:
+    """utime + stime процесса из /proc (только Linux)"""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            fields = stat.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def random_person(rng: random.Random) -> dict:
+    birthdate = date(2004, 1, 1) + timedelta(days=rng.randrange(6 * 365))
+    return {
+        "lastname": f"Фамилия{rng.randrange(10 ** 9)}",
+        "firstname": "Имя",
+        "middlename": "Отчество",
+        "birthdate": birthdate.isoformat(),
+    }
+
+
+async def drive(base_url: str, args) -> Dict[str, object]:
+    rng = random.Random(args.seed)
+    people = [random_person(rng) for _ in range(args.people)] if args.people else None
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    counter = iter(range(args.requests))
+
+    def next_body():
+        def person():
+            return rng.choice(people) if people else random_person(rng)
+        if args.endpoint == "batch":
+            return [person() for _ in range(args.batch_size)]
+        return person()
+
+    path = "/check" if args.endpoint == "check" else "/check/batch"
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        async def worker():
+            for _ in counter:
+                body = next_body()
+                started = time.perf_counter()
+                response = await client.post(path, json=body)
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(args.concurrency)])
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(quantiles[49] * 1000, 1),
+        "p95_ms": round(quantiles[94] * 1000, 1),
+        "p99_ms": round(quantiles[98] * 1000, 1),
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+async def main(args) -> Dict[str, object]:
+    stub_port, app_port = free_port(), free_port()
+    app_env = {"RSOSH_BASE_URL": f"http://127.0.0.1:{stub_port}", "STORAGE_PROBE_ENABLED": "0"}
+    if not args.cache:
+        app_env.update(NO_CACHE_ENV)
+    stub = start_server("benchmarks.stub_server:app", stub_port, {}, args.verbose)
+    server = start_server("app.main:app", app_port, app_env, args.verbose)
+    try:
+        await wait_ready(f"http://127.0.0.1:{stub_port}/")
+        await wait_ready(f"http://127.0.0.1:{app_port}/health")
+        cpu_before = cpu_seconds(server.pid)
+        result = await drive(f"http://127.0.0.1:{app_port}", args)
+        cpu_after = cpu_seconds(server.pid)
+    finally:
+        for process in (server, stub):
+            process.terminate()
+            process.wait(timeout=10)
+    if cpu_before is not None and cpu_after is not None:
+        result["cpu_ms_per_request"] = round((cpu_after - cpu_before) * 1000 / result["requests"], 3)
+    result["config"] = {
+        key: value for key, value in vars(args).items() if key not in ("output", "baseline", "verbose")
+    }
+    result["stub"] = {key: value for key, value in os.environ.items() if key.startswith("STUB_")}
+    return result
+
+
+def compare(result: dict, baseline: dict):
+    print(f"{'metric':>20} {'baseline':>10} {'current':>10} {'change':>8}")
+    for key in ("rps", "p50_ms", "p95_ms", "p99_ms", "cpu_ms_per_request"):
+        if key in result and key in baseline and baseline[key]:
+            change = (result[key] - baseline[key]) / baseline[key] * 100
+            print(f"{key:>20} {baseline[key]:>10} {result[key]:>10} {change:>+7.1f}%")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint", choices=("check", "batch"), default="check")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--people", type=int, default=0, help="размер пула персон; 0 — каждая персона уникальна")
+    parser.add_argument("--cache", action="store_true", help="не отключать кэши приложения")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="показывать вывод заглушки и приложения")
+    parser.add_argument("--output", help="сохранить результат в JSON")
+    parser.add_argument("--baseline", help="JSON предыдущего прогона для сравнения")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    result = asyncio.run(main(args))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as output:
+            json.dump(result, output, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            compare(result, json.load(baseline))
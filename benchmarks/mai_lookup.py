@@ -0,0 +1,48 @@
+"""Сравнение индекса МАИ с прежним линейным просмотром перечня.
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.mai_lookup
+"""
+import random
+import timeit
+
+from app.service import init_olympiads_lookup, is_valid_for_mai
+from benchmarks.fixtures import OLYMPIADS
+
+
+def scan_is_valid_for_mai(olympiad_name: str, speciality: str) -> bool:
+    """Прежняя реализация is_valid_for_mai без вывода в stdout"""
+    for olympiad in OLYMPIADS:
+        if olympiad.name == olympiad_name and olympiad.profile == speciality:
+            return True
+    return False
+
+
+def make_queries(count: int = 1000, seed: int = 0) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        olympiad = rng.choice(OLYMPIADS)
+        profile = olympiad.profile if rng.random() < 0.7 else "несуществующий профиль"
+        queries.append((olympiad.name, profile))
+    return queries
+
+
+def main(number: int = 20):
+    init_olympiads_lookup()
+    queries = make_queries()
+    mismatches = [q for q in queries if scan_is_valid_for_mai(*q) != is_valid_for_mai(*q)]
+    assert not mismatches, mismatches[:3]
+
+    def run(check):
+        for query in queries:
+            check(*query)
+
+    for label, check in (("scan", scan_is_valid_for_mai), ("index", is_valid_for_mai)):
+        best = min(timeit.repeat(lambda: run(check), number=number, repeat=5)) / number
+        print(f"{label:>6}: {best / len(queries) * 1e9:8.0f} ns per lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Микробенчмарки разбора ответа РСОШ по стадиям и целиком.
+
+Стадии повторяют путь ответа: smart_decode → extract_diploma_codes → parse_oa →
+DiplomaData (parse_diplomas), затем is_valid_for_mai (select_eligible), плюс обе
+функции вместе. oa_parse меряет разбор без memoization, oa_cached — повторные строки.
+Каждая стадия меряется на файлах из 1, 10 и 100 дипломов (benchmarks.fixtures).
+Вход стадии готовится заранее, в замер попадает только она сама.
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.pipeline                  # замер и сравнение с историей
+    python -m benchmarks.pipeline --save           # то же и дописать прогон в историю
+    python -m benchmarks.pipeline --threshold 0.1  # порог регрессии 10 %
+
+История хранится в benchmarks/results/pipeline.json (у каждой машины своя).
+Стадия считается регрессией, если она медленнее медианы последних
+--window сохранённых прогонов больше чем на --threshold; тогда код выхода 1.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List
+
+from app.models import DiplomaData, award_fields
+from app.oa_parser import parse_oa
+from app.service import init_olympiads_lookup, is_valid_for_mai, mai_list, parse_diplomas, select_eligible
+from app.utils import extract_diploma_codes, smart_decode
+from benchmarks.fixtures import make_codes_js
+
+SIZES = (1, 10, 100)
+YEAR = 2024
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "pipeline.json")
+
+
+def make_stages(size: int) -> Dict[str, Callable[[], object]]:
+    content = make_codes_js(size, seed=size).encode("utf-8")
+    content_type = "application/javascript"
+    text = smart_decode(content, content_type)
+    raw = extract_diploma_codes(text)
+    oa_strings = [d["oa"] for d in raw]
+    awards = [award for award in map(parse_oa, oa_strings) if award is not None]
+    matches = [(award.name, award.profile) for award in awards]
+    eligibility = mai_list()
+
+    def oa_parse():
+        for oa in oa_strings:
+            parse_oa.__wrapped__(oa)
+
+    def oa_cached():
+        for oa in oa_strings:
+            parse_oa(oa)
+
+    def mai_lookup():
+        for name, profile in matches:
+            is_valid_for_mai(name, profile)
+
+    def construct():
+        for d in raw:
+            DiplomaData(
+                hashed=str(d["hashed"]),
+                oa=str(d["oa"]),
+                link=f"https://diploma.rsr-olymp.ru/files/rsosh-diplomas-static/compiled-storage-{YEAR}/by-code/{d['code']}/white.pdf",
+                form=d["form"],
+                year=YEAR,
+                **award_fields(d["oa"]),
+            )
+
+    return {
+        "decode": lambda: smart_decode(content, content_type),
+        "js_parse": lambda: extract_diploma_codes(text),
+        "oa_parse": oa_parse,
+        "oa_cached": oa_cached,
+        "mai_lookup": mai_lookup,
+        "construct": construct,
+        "end_to_end": lambda: select_eligible(parse_diplomas(content, YEAR, content_type), eligibility),
+    }
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    """Лучшее время одного вызова в микросекундах"""
+    number, _ = timeit.Timer(fn).autorange()
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def run(repeat: int) -> Dict[str, float]:
+    init_olympiads_lookup()
+    results = {}
+    for size in SIZES:
+        for stage, fn in make_stages(size).items():
+            results[f"{stage}/{size}"] = round(measure(fn, repeat), 3)
+    return results
+
+
+def load_history(path: str) -> List[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path) as history:
+        return json.load(history)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def report(results: Dict[str, float], history: List[dict], window: int, threshold: float) -> List[str]:
+    """Печатает таблицу и возвращает стадии, вышедшие за порог"""
+    baseline = {}
+    for key in results:
+        previous = [run["results"][key] for run in history[-window:] if key in run["results"]]
+        if previous:
+            baseline[key] = statistics.median(previous)
+    regressions = []
+    print(f"{'stage':>16} {'us':>10} {'baseline':>10} {'change':>8}")
+    for key, value in results.items():
+        if key not in baseline:
+            print(f"{key:>16} {value:>10.2f} {'-':>10} {'-':>8}")
+            continue
+        change = value / baseline[key] - 1
+        mark = ""
+        if change > threshold:
+            regressions.append(key)
+            mark = "  REGRESSION"
+        print(f"{key:>16} {value:>10.2f} {baseline[key]:>10.2f} {change * 100:>+7.1f}%{mark}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--save", action="store_true", help="дописать прогон в историю")
+    parser.add_argument("--threshold", type=float, default=0.25, help="допустимое замедление, доля")
+    parser.add_argument("--window", type=int, default=5, help="сколько последних прогонов брать в базу")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    results = run(args.repeat)
+    regressions = report(results, history, args.window, args.threshold)
+    if args.save:
+        history.append({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "results": results,
+        })
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        with open(args.history, "w") as output:
+            json.dump(history, output, indent=2)
+    if regressions:
+        print(f"{len(regressions)} stage(s) slower than baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""Сравнение smart_decode с прежним декодированием через chardet.detect.
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.smart_decode
+"""
+import timeit
+
+import chardet
+
+from app.utils import smart_decode
+from benchmarks.fixtures import make_codes_js
+
+
+def chardet_decode(content: bytes) -> str:
+    """Прежняя реализация smart_decode"""
+    result = chardet.detect(content)
+    encoding = result["encoding"] or "utf-8"
+    return content.decode(encoding, errors="replace")
+
+
+def main():
+    print(f"{'payload':>16} {'chardet, us':>12} {'smart, us':>12}")
+    for size in (1, 10, 100):
+        text = make_codes_js(size)
+        for label, content, content_type in (
+            (f"utf-8 x{size}", text.encode("utf-8"), "application/javascript"),
+            (f"cp1251 x{size}", text.encode("cp1251"), "application/javascript; charset=windows-1251"),
+        ):
+            assert smart_decode(content, content_type) == text
+            number = 3 if size == 100 else 10
+            old = min(timeit.repeat(lambda: chardet_decode(content), number=number, repeat=3)) / number
+            new = min(timeit.repeat(lambda: smart_decode(content, content_type), number=200, repeat=5)) / 200
+            print(f"{label:>16} {old * 1e6:>12.1f} {new * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
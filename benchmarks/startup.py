@@ -0,0 +1,77 @@
+"""Время импорта приложения и память процесса с загруженным перечнем олимпиад.
+
+Каждый замер — отдельный чистый процесс интерпретатора: импорт app.main
+(то, что делает каждый воркер uvicorn), затем init_olympiads_lookup().
+Память — VmRSS из /proc (только Linux) и выделенное Python по tracemalloc;
+tracemalloc замедляет импорт, поэтому время и аллокации меряются в разных процессах.
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.startup --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time, tracemalloc
+
+def rss_kb():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+
+import fastapi, httpx, pydantic, prometheus_client  # зависимости не входят в замер
+if sys.argv[1] == "alloc":
+    tracemalloc.start()
+base_rss = rss_kb()
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+import_rss = rss_kb()
+import_alloc = tracemalloc.get_traced_memory()[0]
+from app.service import init_olympiads_lookup
+init_olympiads_lookup()
+ready = time.perf_counter()
+if sys.argv[1] == "alloc":
+    print(json.dumps({
+        "import_alloc_kb": import_alloc / 1024,
+        "total_alloc_kb": tracemalloc.get_traced_memory()[0] / 1024,
+    }))
+else:
+    print(json.dumps({
+        "import_ms": (imported - started) * 1000,
+        "init_ms": (ready - imported) * 1000,
+        "import_rss_kb": import_rss - base_rss,
+        "total_rss_kb": rss_kb() - base_rss,
+    }))
+"""
+
+
+def probe(mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, mode], cwd=ROOT, capture_output=True, text=True, check=True,
+        env={**os.environ, "STORAGE_PROBE_ENABLED": "0"},
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    probe("time")  # прогрев __pycache__
+    samples = [{**probe("time"), **probe("alloc")} for _ in range(args.runs)]
+    for key in samples[0]:
+        values = [sample[key] for sample in samples]
+        print(f"{key:>16}: median {statistics.median(values):9.1f}  min {min(values):9.1f}")
+
+
+if __name__ == "__main__":
+    main()
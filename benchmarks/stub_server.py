@@ -0,0 +1,72 @@
+"""Локальная заглушка diploma.rsr-olymp.ru для нагрузочных тестов.
+
+Отдаёт синтетические codes.js по тем же путям, что строит app.utils.build_url.
+Ответ для персоны детерминирован её хэшем: один и тот же хэш всегда получает
+одинаковые 404, размер файла и кодировку. Параметры задаются переменными окружения:
+
+    STUB_DIPLOMAS      число дипломов в файле (по умолчанию 5)
+    STUB_LATENCY_MS    задержка ответа в миллисекундах (по умолчанию 50)
+    STUB_JITTER_MS     случайная добавка к задержке (по умолчанию 20)
+    STUB_404_RATIO     доля пар (год, персона) без дипломов (по умолчанию 0.7)
+    STUB_CP1251_RATIO  доля ответов в Windows-1251 вместо UTF-8 (по умолчанию 0)
+    STUB_YEARS         опубликованные годы через запятую (по умолчанию — все)
+
+Запуск::
+
+    uvicorn benchmarks.stub_server:app --port 8900
+"""
+import asyncio
+import os
+import random
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from benchmarks.fixtures import make_codes_js
+
+DIPLOMAS = int(os.getenv("STUB_DIPLOMAS", "5"))
+LATENCY = float(os.getenv("STUB_LATENCY_MS", "50")) / 1000
+JITTER = float(os.getenv("STUB_JITTER_MS", "20")) / 1000
+NOT_FOUND_RATIO = float(os.getenv("STUB_404_RATIO", "0.7"))
+CP1251_RATIO = float(os.getenv("STUB_CP1251_RATIO", "0"))
+YEARS = {int(year) for year in os.getenv("STUB_YEARS", "").split(",") if year.strip()}
+
+_BODIES = {}
+
+
+def _body(seed: int, encoding: str) -> bytes:
+    key = (seed % 64, encoding)
+    if key not in _BODIES:
+        _BODIES[key] = make_codes_js(DIPLOMAS, seed % 64).encode(encoding)
+    return _BODIES[key]
+
+
+async def codes(request: Request) -> Response:
+    year = int(request.path_params["year"])
+    rng = random.Random(f"{year}:{request.path_params['person']}")
+    await asyncio.sleep(LATENCY + rng.random() * JITTER)
+    if (YEARS and year not in YEARS) or rng.random() < NOT_FOUND_RATIO:
+        return Response(status_code=404)
+    if rng.random() < CP1251_RATIO:
+        return Response(_body(rng.randrange(1 << 30), "cp1251"), media_type="application/javascript; charset=windows-1251")
+    return Response(_body(rng.randrange(1 << 30), "utf-8"), media_type="application/javascript")
+
+
+async def storage(request: Request) -> Response:
+    """Файлы внутри compiled-storage-{year}/ для STORAGE_PROBE_PATH; каталог, как и на многих статических хостах, — 404"""
+    year = int(request.path_params["year"])
+    if not request.path_params["path"] or (YEARS and year not in YEARS):
+        return Response(status_code=404)
+    return Response(status_code=200)
+
+
+app = Starlette(routes=[
+    Route(
+        "/files/rsosh-diplomas-static/compiled-storage-{year:int}/by-person-released/{person}/codes.js",
+        codes,
+        methods=["GET"],
+    ),
+    Route("/files/rsosh-diplomas-static/compiled-storage-{year:int}/{path:path}", storage, methods=["GET", "HEAD"]),
+])
@@ -0,0 +1,33 @@
+import httpx
+import pytest
+
+from app import availability, http_client, service
+from app.resilience import CircuitBreaker
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Подменяет РСОШ ответами по году: код статуса или тело codes.js (200), по умолчанию 404.
+
+    Возвращает словарь ответов и журнал запрошенных лет.
+    """
+    responses = {}
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        year = int(request.url.path.split("compiled-storage-")[1].split("/")[0])
+        requested.append(year)
+        response = responses.get(year, 404)
+        if isinstance(response, int):
+            return httpx.Response(response)
+        return httpx.Response(200, content=response, headers={"content-type": "application/javascript"})
+
+    monkeypatch.setattr(http_client, "HTTP_CLIENT", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(service, "UPSTREAM_BREAKER", CircuitBreaker())
+    monkeypatch.setattr(availability, "STORAGE_YEARS", {})
+    monkeypatch.setattr(service.store, "STORE", None)
+    service.YEAR_CACHE.clear()
+    service.RESULT_CACHE.clear()
+    yield responses, requested
+    service.YEAR_CACHE.clear()
+    service.RESULT_CACHE.clear()
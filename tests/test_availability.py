@@ -0,0 +1,49 @@
+"""Годы хранилища, отмеченные проверкой как неопубликованные, и неполные результаты"""
+import asyncio
+from datetime import date, datetime
+
+from app import availability, resilience, service
+from app.models import Person
+from app.utils import sha256_hash
+
+CURRENT_YEAR = datetime.now().year
+
+
+def make_person(firstname: str) -> Person:
+    return Person(
+        lastname="Иванов", firstname=firstname, middlename="Иванович",
+        birthdate=date(CURRENT_YEAR - 18, 3, 1),
+    )
+
+
+def test_filter_available_skips_only_confirmed_unpublished(monkeypatch):
+    monkeypatch.setattr(availability, "STORAGE_YEARS", {CURRENT_YEAR: False, CURRENT_YEAR - 1: True})
+    years = [CURRENT_YEAR, CURRENT_YEAR - 1, CURRENT_YEAR - 2]
+    assert availability.filter_available(years) == [CURRENT_YEAR - 1, CURRENT_YEAR - 2]
+
+
+def test_unpublished_year_is_an_empty_result(upstream):
+    responses, requested = upstream
+    availability.STORAGE_YEARS[CURRENT_YEAR] = False
+    result = asyncio.run(service.get_all_diplomas(make_person("Unpublished")))
+    assert result.diplomas == []
+    assert result.incomplete_years == []
+    assert CURRENT_YEAR not in requested
+
+
+def test_unpublished_year_result_is_cached(upstream):
+    responses, requested = upstream
+    availability.STORAGE_YEARS[CURRENT_YEAR] = False
+    person = make_person("Cached")
+    result = asyncio.run(service.get_diplomas_data(person))
+    assert result == ([], [])
+    assert service.RESULT_CACHE.get((sha256_hash(person), service.mai_list().version)) == []
+
+
+def test_upstream_error_is_incomplete(upstream, monkeypatch):
+    responses, requested = upstream
+    monkeypatch.setattr(resilience, "UPSTREAM_RETRY_BASE_DELAY", 0)
+    responses[CURRENT_YEAR] = 500
+    result = asyncio.run(service.get_all_diplomas(make_person("Failing")))
+    assert result.diplomas == []
+    assert result.incomplete_years == [CURRENT_YEAR]
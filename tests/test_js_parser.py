@@ -0,0 +1,41 @@
+"""Сверка быстрого парсера codes.js с js2py на корпусе из benchmarks.codes_js_parser.
+
+Запуск из корня репозитория::
+
+    python -m pytest tests
+"""
+import pytest
+
+from app.js_parser import JSParseError, parse_diploma_codes
+from app.utils import extract_diploma_codes_with_js2py
+from benchmarks.codes_js_parser import CORPUS, REJECTED
+
+
+@pytest.mark.parametrize("sample", CORPUS)
+def test_matches_js2py(sample):
+    assert parse_diploma_codes(sample) == extract_diploma_codes_with_js2py(sample)
+
+
+@pytest.mark.parametrize("sample", REJECTED)
+def test_rejects_non_literal(sample):
+    with pytest.raises(JSParseError):
+        parse_diploma_codes(sample)
+
+
+# js2py оставляет экранированную суррогатную пару двумя одиночными суррогатами,
+# поэтому здесь ожидаемое значение задаётся явно и совпадает с json
+@pytest.mark.parametrize("sample, expected", [
+    ("var diplomaCodes = [{s: '\\ud83d\\ude00'}];", "\U0001f600"),
+    ("var diplomaCodes = [{'s': \"\\uD83D\\uDE00!\"}];", "\U0001f600!"),
+    ('var diplomaCodes = [{"s": "\\ud83d\\ude00"}];', "\U0001f600"),
+    ("var diplomaCodes = [{s: '\\ud83d\\u0041'}];", "\ud83dA"),
+    ("var diplomaCodes = [{s: '\\ude00\\ud83d'}];", "\ude00\ud83d"),
+])
+def test_surrogate_pairs(sample, expected):
+    assert parse_diploma_codes(sample) == [{"s": expected}]
+
+
+def test_surrogate_pair_encodes_to_utf8():
+    # одиночные суррогаты не кодируются в UTF-8, и на них падают orjson и pydantic
+    codes = parse_diploma_codes("var diplomaCodes = [{oa: '\\ud83d\\ude00'}];")
+    assert codes[0]["oa"].encode("utf-8") == "\U0001f600".encode("utf-8")
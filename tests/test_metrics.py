@@ -0,0 +1,36 @@
+"""Счётчики решений по дипломам считаются только на пути /check"""
+import asyncio
+from datetime import date, datetime
+
+from app import metrics, service
+from app.models import Person
+from benchmarks.fixtures import make_codes_js
+
+CURRENT_YEAR = datetime.now().year
+PERSON = Person(lastname="Иванов", firstname="Иван", middlename="Иванович", birthdate=date(CURRENT_YEAR - 18, 3, 1))
+
+
+def filtered() -> dict:
+    samples = {
+        reason: metrics.REGISTRY.get_sample_value("diploma_filtered_total", {"reason": reason}) or 0
+        for reason in ("form", "oa_mismatch", "not_in_list")
+    }
+    samples["accepted"] = metrics.REGISTRY.get_sample_value("diploma_accepted_total") or 0
+    return samples
+
+
+def test_annotated_check_does_not_count(upstream):
+    responses, requested = upstream
+    responses[CURRENT_YEAR] = make_codes_js(30, 7).encode()
+
+    before = filtered()
+    annotated = asyncio.run(service.get_annotated_diplomas(PERSON))
+    assert filtered() == before
+
+    asyncio.run(service.get_diplomas_data(PERSON))
+    after = filtered()
+    reasons = [diploma.reason or "accepted" for diploma in annotated.diplomas]
+    assert {key: after[key] - before[key] for key in after} == {key: reasons.count(key) for key in after}
+
+    asyncio.run(service.get_annotated_diplomas(PERSON))
+    assert filtered() == after
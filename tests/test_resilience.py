@@ -0,0 +1,74 @@
+"""Автоматический выключатель и хеджирование запросов к РСОШ"""
+import asyncio
+
+from app import resilience
+from app.resilience import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def tripped_breaker(clock: FakeClock) -> CircuitBreaker:
+    breaker = CircuitBreaker(window=10, min_calls=4, failure_rate=0.5, open_seconds=10, clock=clock)
+    for _ in range(4):
+        breaker.record(True, 0.1)
+    assert breaker.state == "open"
+    return breaker
+
+
+def test_late_failures_do_not_extend_open_window():
+    clock = FakeClock()
+    breaker = tripped_breaker(clock)
+    clock.now = 6
+    # вызовы, начавшиеся до размыкания, завершаются ошибками уже в состоянии open
+    for _ in range(20):
+        breaker.record(True, 0.1)
+    assert breaker.opened == 1
+    assert breaker.retry_after() == 4
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+
+
+def test_half_open_probe_failure_reopens():
+    clock = FakeClock()
+    breaker = tripped_breaker(clock)
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record(True, 0.1)
+    assert breaker.state == "open"
+    assert breaker.retry_after() == 10
+
+
+def test_hedged_cancels_primary_when_cancelled_before_hedge(monkeypatch):
+    monkeypatch.setattr(resilience, "HEDGE_ENABLED", True)
+    monkeypatch.setattr(resilience, "hedge_delay", lambda: 10.0)
+    started = []
+    cancelled = []
+
+    async def request():
+        started.append(asyncio.current_task())
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(asyncio.current_task())
+            raise
+
+    async def main():
+        call = asyncio.ensure_future(resilience.hedged(request))
+        await asyncio.sleep(0.01)
+        assert len(started) == 1
+        call.cancel()
+        await asyncio.gather(call, return_exceptions=True)
+        await asyncio.sleep(0)
+        # проверка внутри цикла: при завершении asyncio.run сам отменяет оставшиеся задачи
+        assert call.cancelled()
+        assert started[0].done()
+        assert cancelled == started
+
+    asyncio.run(main())